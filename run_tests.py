@@ -4,39 +4,51 @@ Test runner for the stock screener project
 """
 
 import argparse
+import importlib.util
 import os
-import subprocess
 import sys
 from pathlib import Path
 
 
-def run_command(command, description=""):
-    """Run a command and return success status"""
+def combine_markers(*expressions):
+    """Join marker expressions so a test must match all of them"""
+    return ' and '.join(f'({expr})' for expr in expressions if expr)
+
+
+def run_command(pytest_args, description="", allow_empty=False):
+    """Run pytest in-process with the given arguments and return success status
+
+    With allow_empty, a selection that deselects every test also counts as
+    success.
+    """
+    import pytest
+
     print(f"\n{'='*60}")
     print(f"🧪 {description}")
     print(f"{'='*60}")
-    print(f"Running: {' '.join(command)}")
+    print(f"Running: pytest {' '.join(pytest_args)}")
     print()
 
-    # Set up environment with src in PYTHONPATH
-    env = os.environ.copy()
-    current_pythonpath = env.get('PYTHONPATH', '')
+    # Make src importable in this process and in any subprocess pytest
+    # starts (e.g. the --looponfail runner)
     src_path = str(Path.cwd() / 'src')
-    if current_pythonpath:
-        env['PYTHONPATH'] = f"{src_path}:{current_pythonpath}"
-    else:
-        env['PYTHONPATH'] = src_path
-
-    try:
-        subprocess.run(command, check=True, capture_output=False, env=env)
+    if src_path not in sys.path:
+        sys.path.insert(0, src_path)
+    current_pythonpath = os.environ.get('PYTHONPATH', '')
+    if src_path not in current_pythonpath.split(os.pathsep):
+        os.environ['PYTHONPATH'] = os.pathsep.join(
+            path for path in (src_path, current_pythonpath) if path
+        )
+
+    exit_code = pytest.main(pytest_args)
+    if exit_code == 0 or (
+        allow_empty and exit_code == pytest.ExitCode.NO_TESTS_COLLECTED
+    ):
         print(f"\n✅ {description} - PASSED")
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"\n❌ {description} - FAILED (exit code: {e.returncode})")
-        return False
-    except FileNotFoundError:
-        print(f"\n❌ {description} - FAILED (command not found)")
-        return False
+
+    print(f"\n❌ {description} - FAILED (exit code: {int(exit_code)})")
+    return False
 
 
 def main():
@@ -51,6 +63,8 @@ Examples:
   python run_tests.py --coverage         # Run with coverage report
   python run_tests.py --fast             # Skip slow tests
   python run_tests.py --verbose          # Verbose output
+  python run_tests.py --no-parallel      # Run tests serially
+  python run_tests.py --watch            # Re-run failing tests on file change
         """
     )
 
@@ -85,9 +99,15 @@ Examples:
     )
 
     parser.add_argument(
-        '--parallel', '-p',
+        '--no-parallel',
+        action='store_true',
+        help='Run tests serially instead of across all CPU cores'
+    )
+
+    parser.add_argument(
+        '--watch', '-w',
         action='store_true',
-        help='Run tests in parallel'
+        help='Watch for file changes and re-run failing tests (needs pytest-xdist)'
     )
 
     parser.add_argument(
@@ -102,8 +122,28 @@ Examples:
 
     args = parser.parse_args()
 
-    # Build pytest command
-    cmd = ['python', '-m', 'pytest']
+    # Check that pytest is available before building any arguments; pytest
+    # itself is only imported once the tests actually run
+    if importlib.util.find_spec('pytest') is None:
+        print("❌ pytest not found. Please install test dependencies:")
+        print("   pip install -r requirements.txt")
+        return 1
+
+    has_xdist = importlib.util.find_spec('xdist') is not None
+    if args.watch and not has_xdist:
+        print("❌ --watch requires pytest-xdist. Please install test dependencies:")
+        print("   pip install -r requirements.txt")
+        return 1
+
+    # --looponfail is deprecated in pytest-xdist 3.x; once a release drops
+    # it, pytest would reject the flag while parsing arguments
+    if args.watch and importlib.util.find_spec('xdist.looponfail') is None:
+        print("❌ --watch needs --looponfail, which this pytest-xdist has dropped")
+        print("   pip install 'pytest-xdist>=3.0.0,<4'")
+        return 1
+
+    # Build pytest arguments
+    cmd = []
 
     # Add test paths
     if args.unit:
@@ -113,8 +153,9 @@ Examples:
     else:
         cmd.append('tests/')
 
-    # Add coverage if requested
-    if args.coverage:
+    # Add coverage if requested; watch mode skips it since every re-run
+    # would re-instrument the code
+    if args.coverage and not args.watch:
         cmd.extend(['--cov=src/models', '--cov=src/services', '--cov=src/gateways', '--cov=src/utils'])
         cmd.extend(['--cov-report=term-missing', '--cov-report=html:htmlcov'])
 
@@ -124,20 +165,38 @@ Examples:
     else:
         cmd.append('--tb=short')
 
-    # Add parallel execution
-    if args.parallel:
-        cmd.extend(['-n', 'auto'])
+    # Run in parallel by default, grouping tests by module so fixture setup
+    # is shared; pattern-matched runs are too small to benefit
+    parallel = False
+    if args.watch:
+        # Start from the last failures and loop on the failing set on change
+        cmd.extend(['--looponfail', '--last-failed'])
+    elif not args.no_parallel and not args.pattern:
+        if has_xdist:
+            parallel = True
+        else:
+            print("⚠️  pytest-xdist not installed, running tests serially")
 
     # Add markers
+    markers = None
     if args.fast:
-        cmd.extend(['-m', 'not slow'])
+        markers = 'not slow'
     elif args.markers:
-        cmd.extend(['-m', args.markers])
+        markers = args.markers
 
     # Add pattern matching
     if args.pattern:
         cmd.extend(['-k', args.pattern])
 
+    # sys-level capture is cheaper than the default fd capture; verbose runs
+    # keep the default
+    if not args.verbose:
+        cmd.append('--capture=sys')
+
+    # The cache only helps iterative runs (--lf/--ff), not one-off suite runs
+    if not args.fast and not args.coverage and not args.watch:
+        cmd.extend(['-p', 'no:cacheprovider'])
+
     # Additional options
     cmd.extend([
         '--strict-markers',
@@ -148,17 +207,24 @@ Examples:
     print("🔍 Stock Screener Test Suite")
     print("="*60)
 
-    # Check if pytest is available
-    try:
-        subprocess.run(['python', '-m', 'pytest', '--version'],
-                      check=True, capture_output=True)
-    except subprocess.CalledProcessError:
-        print("❌ pytest not found. Please install test dependencies:")
-        print("   pip install -r requirements.txt")
-        return 1
-
-    # Run tests
-    success = run_command(cmd, "Running Tests")
+    # Run tests. Timing-sensitive tests would compete with the workers for
+    # CPU, so a parallel run leaves them to a second, serial pass
+    if parallel:
+        success = run_command(
+            cmd + ['-n', 'auto', '--dist', 'loadscope',
+                   '-m', combine_markers(markers, 'not serial')],
+            "Running Tests"
+        )
+        serial_cmd = cmd + ['-m', combine_markers(markers, 'serial')]
+        if args.coverage:
+            serial_cmd.append('--cov-append')
+        success = run_command(
+            serial_cmd, "Running Serial Tests", allow_empty=True
+        ) and success
+    else:
+        if markers:
+            cmd.extend(['-m', markers])
+        success = run_command(cmd, "Running Tests")
 
     if success:
         print("\n🎉 All tests passed!")
@@ -177,7 +243,6 @@ Examples:
 def run_quick_tests():
     """Run a quick subset of tests for CI/development"""
     cmd = [
-        'python', '-m', 'pytest',
         'tests/unit',
         '-v',
         '--tb=short',
@@ -190,43 +255,21 @@ def run_quick_tests():
 
 def run_full_test_suite():
     """Run the complete test suite with coverage"""
-    commands = [
-        # Unit tests with coverage
-        ([
-            'python', '-m', 'pytest',
-            'tests/unit',
-            '--cov=src/models',
-            '--cov=src/services',
-            '--cov=src/gateways',
-            '--cov=src/utils',
-            '--cov-report=term-missing',
-            '-v'
-        ], "Unit Tests with Coverage"),
-
-        # Integration tests
-        ([
-            'python', '-m', 'pytest',
-            'tests/integration',
-            '-v',
-            '--tb=short'
-        ], "Integration Tests"),
-
-        # Signal accuracy tests
-        ([
-            'python', '-m', 'pytest',
-            'tests/integration/test_signal_accuracy.py',
-            '-v',
-            '--tb=long'
-        ], "Signal Accuracy Tests")
+    # A single run collects the unit and integration tests (including the
+    # signal accuracy tests) once instead of once per suite
+    cmd = [
+        'tests/unit',
+        'tests/integration',
+        '--cov=src/models',
+        '--cov=src/services',
+        '--cov=src/gateways',
+        '--cov=src/utils',
+        '--cov-report=term-missing',
+        '-v',
+        '--tb=short'
     ]
 
-    all_passed = True
-    for cmd, description in commands:
-        success = run_command(cmd, description)
-        if not success:
-            all_passed = False
-
-    return all_passed
+    return run_command(cmd, "Full Test Suite with Coverage")
 
 
 if __name__ == '__main__':
@@ -3,14 +3,29 @@ Stock data gateway for fetching data from external APIs
 """
 
 import logging
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
 logger = logging.getLogger(__name__)
 
+# Environment variable overriding the size of the fetch thread pool
+MAX_WORKERS_ENV_VAR = "SCREENER_MAX_WORKERS"
+
+# Default location for cached OHLCV frames, under the project root so it does
+# not depend on the directory the screener is started from
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[2] / ".cache" / "yfinance"
+
+# OHLCV columns every fetched frame must provide
+_REQUIRED_COLUMNS = frozenset({"Open", "High", "Low", "Close", "Volume"})
+
 
 class StockDataGateway(ABC):
     """Abstract base class for stock data gateways"""
@@ -20,12 +35,91 @@ class StockDataGateway(ABC):
         """Fetch stock data for a symbol"""
         pass
 
+    def fetch_many(
+        self, symbols: list[str], period: str = "3mo"
+    ) -> dict[str, Optional[pd.DataFrame]]:
+        """
+        Fetch stock data for several symbols
+
+        Gateways that support batch requests should override this; the
+        default fetches each symbol concurrently via fetch_stock_data.
+
+        Args:
+            symbols (List[str]): Stock symbols to fetch
+            period (str): Time period
+
+        Returns:
+            Dict[str, pd.DataFrame]: Fetched data per symbol (None where the fetch failed)
+        """
+        return fetch_all(self, symbols, period)
+
+
+def _default_max_workers(symbol_count: int) -> int:
+    """Size the fetch pool from the environment or the available CPUs"""
+    configured = os.getenv(MAX_WORKERS_ENV_VAR)
+    if configured and configured.isdigit() and int(configured) > 0:
+        workers = int(configured)
+    else:
+        # Fetching is I/O-bound, so allow more threads than cores
+        workers = min(32, (os.cpu_count() or 1) + 4)
+    return max(1, min(workers, symbol_count))
+
+
+def fetch_all(
+    gateway: StockDataGateway,
+    symbols: list[str],
+    period: str = "3mo",
+    max_workers: Optional[int] = None,
+) -> dict[str, Optional[pd.DataFrame]]:
+    """
+    Fetch data for several symbols concurrently
+
+    Args:
+        gateway (StockDataGateway): Gateway used for each individual fetch
+        symbols (List[str]): Stock symbols to fetch
+        period (str): Time period passed through to the gateway
+        max_workers (int, optional): Thread pool size (default: from environment/CPUs)
+
+    Returns:
+        Dict[str, pd.DataFrame]: Fetched data per symbol (None where the fetch failed)
+    """
+    unique_symbols = list(dict.fromkeys(symbols))
+    if not unique_symbols:
+        return {}
+
+    workers = max_workers or _default_max_workers(len(unique_symbols))
+    frames: dict[str, Optional[pd.DataFrame]] = {}
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(gateway.fetch_stock_data, symbol, period): symbol
+            for symbol in unique_symbols
+        }
+        for future in as_completed(futures):
+            symbol = futures[future]
+            try:
+                frames[symbol] = future.result()
+            except Exception as e:
+                logger.error(f"Error fetching data for {symbol}: {str(e)}")
+                frames[symbol] = None
+
+    return frames
+
 
 class YahooFinanceGateway(StockDataGateway):
     """Gateway for fetching stock data from Yahoo Finance"""
 
-    def __init__(self):
-        self.session = None
+    def __init__(self, cache_dir: Optional[Path] = DEFAULT_CACHE_DIR, session=None):
+        """
+        Initialize the Yahoo Finance gateway
+
+        Args:
+            cache_dir (Path, optional): Directory for cached daily data, None disables caching
+            session (optional): HTTP session shared by every request this gateway
+                makes; None uses yfinance's own pooled session
+        """
+        self.session = session
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
 
     def fetch_stock_data(
         self, symbol: str, period: str = "3mo"
@@ -40,44 +134,205 @@ class YahooFinanceGateway(StockDataGateway):
         Returns:
             pd.DataFrame: Stock data with OHLCV information, or None if failed
         """
+        cached = self._load_cached(symbol, period)
+        if cached is not None:
+            return cached
+
         try:
             logger.info(f"Fetching data for {symbol} with period {period}")
 
             # Create ticker object
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=self.session)
 
             # Fetch historical data
             data = ticker.history(period=period)
 
-            # Validate data
-            if data.empty:
-                logger.warning(f"No data found for symbol: {symbol}")
-                return None
+            validated = self._validate_frame(data, symbol)
+            if validated is not None:
+                self._store_cached(symbol, period, validated)
+            return validated
 
-            # Check for required columns
-            required_columns = ["Open", "High", "Low", "Close", "Volume"]
-            missing_columns = [
-                col for col in required_columns if col not in data.columns
-            ]
+        except Exception as e:
+            logger.error(f"Error fetching data for {symbol}: {str(e)}")
+            return None
 
-            if missing_columns:
-                logger.error(
-                    f"Missing required columns for {symbol}: {missing_columns}"
-                )
-                return None
+    def fetch_many(
+        self, symbols: list[str], period: str = "3mo"
+    ) -> dict[str, Optional[pd.DataFrame]]:
+        """
+        Fetch stock data for several symbols in a single batched download
 
-            # Validate data quality
-            if self._validate_data_quality(data, symbol):
-                logger.info(
-                    f"Successfully fetched {len(data)} rows of data for {symbol}"
-                )
-                return data
+        Args:
+            symbols (List[str]): Stock symbols (e.g., ['AAPL', 'MSFT'])
+            period (str): Time period (1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)
+
+        Returns:
+            Dict[str, pd.DataFrame]: Validated data per symbol (None where unavailable)
+        """
+        frames: dict[str, Optional[pd.DataFrame]] = {}
+        to_download = []
+        for symbol in dict.fromkeys(symbols):
+            cached = self._load_cached(symbol, period)
+            if cached is not None:
+                frames[symbol] = cached
             else:
-                logger.warning(f"Data quality validation failed for {symbol}")
-                return None
+                to_download.append(symbol)
+
+        if not to_download:
+            return frames
+
+        try:
+            logger.info(
+                f"Batch fetching data for {len(to_download)} symbols "
+                f"with period {period}"
+            )
+
+            batch = yf.download(
+                " ".join(to_download),
+                period=period,
+                group_by="ticker",
+                threads=True,
+                progress=False,
+                auto_adjust=True,
+                session=self.session,
+            )
 
         except Exception as e:
-            logger.error(f"Error fetching data for {symbol}: {str(e)}")
+            logger.warning(
+                f"Batch download failed, falling back to per-symbol fetch: {str(e)}"
+            )
+            frames.update(super().fetch_many(to_download, period))
+            return frames
+
+        for symbol in to_download:
+            try:
+                validated = self._validate_frame(
+                    self._extract_symbol_frame(batch, symbol), symbol
+                )
+                if validated is not None:
+                    self._store_cached(symbol, period, validated)
+                frames[symbol] = validated
+            except Exception as e:
+                logger.error(f"Error fetching data for {symbol}: {str(e)}")
+                frames[symbol] = None
+
+        return frames
+
+    def _cache_path(self, symbol: str, period: str) -> Optional[Path]:
+        """Get the cache file for a symbol/period fetched today"""
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{symbol}_{period}_{date.today().isoformat()}.parquet"
+
+    def _load_cached(self, symbol: str, period: str) -> Optional[pd.DataFrame]:
+        """
+        Load today's cached data for a symbol
+
+        Args:
+            symbol (str): Stock symbol
+            period (str): Time period
+
+        Returns:
+            pd.DataFrame: Cached data or None if not cached
+        """
+        path = self._cache_path(symbol, period)
+        if path is None or not path.is_file():
+            return None
+
+        try:
+            data = pd.read_parquet(path)
+            logger.info(f"Loaded {len(data)} cached rows of data for {symbol}")
+            return data
+        except Exception as e:
+            logger.warning(f"Could not read cached data for {symbol}: {str(e)}")
+            return None
+
+    def _store_cached(self, symbol: str, period: str, data: pd.DataFrame) -> None:
+        """
+        Cache validated data for a symbol
+
+        Args:
+            symbol (str): Stock symbol
+            period (str): Time period
+            data (pd.DataFrame): Validated stock data
+        """
+        path = self._cache_path(symbol, period)
+        if path is None:
+            return
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            data.to_parquet(path)
+        except Exception as e:
+            logger.warning(f"Could not cache data for {symbol}: {str(e)}")
+            return
+
+        # Only today's file is ever read, so drop this symbol/period's older days
+        try:
+            for stale in path.parent.glob(f"{symbol}_{period}_????-??-??.parquet"):
+                if stale != path:
+                    stale.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not prune cached data for {symbol}: {str(e)}")
+
+    @staticmethod
+    def _extract_symbol_frame(batch: pd.DataFrame, symbol: str) -> pd.DataFrame:
+        """
+        Split a single symbol's OHLCV columns out of a batched download
+
+        Args:
+            batch (pd.DataFrame): Result of yf.download grouped by ticker
+            symbol (str): Stock symbol to extract
+
+        Returns:
+            pd.DataFrame: Data for the symbol (empty if it was not returned)
+        """
+        if batch is None or batch.empty:
+            return pd.DataFrame()
+
+        if isinstance(batch.columns, pd.MultiIndex):
+            if symbol not in batch.columns.get_level_values(0):
+                return pd.DataFrame()
+            data = batch[symbol]
+        else:
+            # Single-level columns only happen for single-ticker downloads
+            data = batch
+
+        return data.dropna(how="all")
+
+    def _validate_frame(
+        self, data: pd.DataFrame, symbol: str
+    ) -> Optional[pd.DataFrame]:
+        """
+        Check fetched data for emptiness, required columns and quality
+
+        Args:
+            data (pd.DataFrame): Fetched stock data
+            symbol (str): Stock symbol for logging
+
+        Returns:
+            pd.DataFrame: The data if it passes validation, otherwise None
+        """
+        # Validate data
+        if data.empty:
+            logger.warning(f"No data found for symbol: {symbol}")
+            return None
+
+        # Check for required columns
+        missing_columns = _REQUIRED_COLUMNS.difference(data.columns)
+
+        if missing_columns:
+            logger.error(
+                f"Missing required columns for {symbol}: {sorted(missing_columns)}"
+            )
+            return None
+
+        # Validate data quality
+        if self._validate_data_quality(data, symbol):
+            logger.info(f"Successfully fetched {len(data)} rows of data for {symbol}")
+            return data
+        else:
+            logger.warning(f"Data quality validation failed for {symbol}")
             return None
 
     def _validate_data_quality(self, data: pd.DataFrame, symbol: str) -> bool:
@@ -97,10 +352,14 @@ class YahooFinanceGateway(StockDataGateway):
                 logger.warning(f"Insufficient data points for {symbol}: {len(data)}")
                 return False
 
+            close = data["Close"].to_numpy(dtype=float)
+            volume = data["Volume"].to_numpy(dtype=float)
+            close_nulls = np.isnan(close)
+            volume_nulls = np.isnan(volume)
+
             # Check for null values in critical columns
-            critical_columns = ["Close", "Volume"]
-            for col in critical_columns:
-                null_count = data[col].isnull().sum()
+            for col, nulls in (("Close", close_nulls), ("Volume", volume_nulls)):
+                null_count = int(nulls.sum())
                 if null_count > 0:
                     logger.warning(
                         f"Found {null_count} null values in {col} for {symbol}"
@@ -110,10 +369,9 @@ class YahooFinanceGateway(StockDataGateway):
                         return False
 
             # Check for reasonable price ranges
-            close_prices = data["Close"].dropna()
-            if len(close_prices) > 0:
-                min_price = close_prices.min()
-                max_price = close_prices.max()
+            if not close_nulls.all():
+                min_price = np.nanmin(close)
+                max_price = np.nanmax(close)
 
                 # Basic sanity checks
                 if min_price <= 0:
@@ -129,8 +387,7 @@ class YahooFinanceGateway(StockDataGateway):
                     # This might be valid for some stocks, so just warn but don't fail
 
             # Check for reasonable volume
-            volumes = data["Volume"].dropna()
-            if len(volumes) > 0 and volumes.sum() == 0:
+            if not volume_nulls.all() and np.nansum(volume) == 0:
                 logger.warning(f"No volume data for {symbol}")
                 # Some stocks might have no volume, so don't fail
 
@@ -151,7 +408,7 @@ class YahooFinanceGateway(StockDataGateway):
             dict: Stock information or None if failed
         """
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=self.session)
             info = ticker.info
 
             if info:
@@ -178,24 +435,21 @@ class YahooFinanceGateway(StockDataGateway):
         Returns:
             bool: True if connection is working
         """
-        import os
-        
         # In CI environments, skip the actual network test
-        if os.getenv('CI') or os.getenv('GITHUB_ACTIONS'):
+        if os.getenv("CI") or os.getenv("GITHUB_ACTIONS"):
             logger.info("CI environment detected, skipping network connectivity test")
             return True
-            
+
         try:
-            # Try to fetch data for a well-known stock with timeout
-            import yfinance as yf
-            
-            # Quick connectivity test with minimal data
-            ticker = yf.Ticker("AAPL")
-            # Just check if we can get basic info without full history
-            info = ticker.info
-            return info is not None and len(info) > 0
-            
-        except Exception as e:
-            logger.warning(f"Connection test failed, but this may be due to network restrictions: {str(e)}")
-            # In case of network issues, assume connection is okay for resilience
+            # fast_info derives last_price from a year of daily history, so this
+            # probes the same chart endpoint the screener downloads from
+            ticker = yf.Ticker("AAPL", session=self.session)
+            last_price = ticker.fast_info["last_price"]
+            if last_price is None or not np.isfinite(last_price):
+                logger.warning("Connection test failed: no last price for AAPL")
+                return False
             return True
+
+        except Exception as e:
+            logger.warning(f"Connection test failed: {str(e)}")
+            return False
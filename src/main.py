@@ -8,7 +8,7 @@ import argparse
 import sys
 import time
 
-from gateways.stock_data_gateway import YahooFinanceGateway
+from gateways.stock_data_gateway import DEFAULT_CACHE_DIR, YahooFinanceGateway
 from services.screener_service import ScreenerConfiguration, StockScreenerService
 from utils.display import ResultsDisplayService
 
@@ -19,25 +19,29 @@ from utils.logging_config import LoggingConfig, setup_default_logging
 logger = LoggingConfig.get_logger(__name__)
 
 
-def get_default_symbols() -> list[str]:
-    """Get the default list of symbols to screen"""
-    return [
-        "AAPL",
-        "GOOGL",
-        "MSFT",
-        "AMZN",
-        "TSLA",
-        "NVDA",
-        "META",
-        "NFLX",
-        "AMD",
-        "CRM",
-        "BABA",
-        "UBER",
-        "SHOP",
-        "SQ",
-        "PYPL",
-    ]
+# Default symbols to screen
+_DEFAULT_SYMBOLS = (
+    "AAPL",
+    "GOOGL",
+    "MSFT",
+    "AMZN",
+    "TSLA",
+    "NVDA",
+    "META",
+    "NFLX",
+    "AMD",
+    "CRM",
+    "BABA",
+    "UBER",
+    "SHOP",
+    "SQ",
+    "PYPL",
+)
+
+
+def get_default_symbols() -> tuple[str, ...]:
+    """Get the default symbols to screen"""
+    return _DEFAULT_SYMBOLS
 
 
 def parse_arguments():
@@ -54,6 +58,7 @@ Examples:
   python main.py --mode top-opportunities --limit 3 # Top 3 opportunities
   python main.py --quiet                           # Quiet mode
   python main.py --health-check                    # System health check
+  python main.py --no-cache                        # Ignore cached market data
         """,
     )
 
@@ -90,6 +95,13 @@ Examples:
         help="Breakout threshold percentage (default: 0.02 = 2%%)",
     )
 
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Maximum number of stocks analyzed concurrently (default: up to 32)",
+    )
+
     # Operating modes
     parser.add_argument(
         "--mode",
@@ -123,6 +135,12 @@ Examples:
 
     parser.add_argument("--log-file", help="Log to specified file")
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always download fresh data instead of using today's cached data",
+    )
+
     return parser.parse_args()
 
 
@@ -250,10 +268,13 @@ def main():
             period=args.period,
             volume_spike_threshold=args.volume_threshold,
             breakout_threshold=args.breakout_threshold,
+            max_workers=args.max_workers,
         )
 
         # Initialize screener service
-        data_gateway = YahooFinanceGateway()
+        data_gateway = YahooFinanceGateway(
+            cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR
+        )
         screener_service = StockScreenerService(config, data_gateway)
 
         # Health check mode
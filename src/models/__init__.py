@@ -1 +1,6 @@
 # Models package for stock screener data structures
+
+import sys
+
+# dataclass(slots=True) is only available on Python 3.10+
+DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -2,18 +2,29 @@
 Screening result model for representing complete stock analysis results
 """
 
-from dataclasses import dataclass
+import heapq
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Optional
 
+import pandas as pd
+
+from . import DATACLASS_OPTIONS
 from .signals import CombinedSignals
 from .stock import StockPrice
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ScreeningResult:
     """Complete screening result for a single stock"""
 
     stock_price: StockPrice
     signals: CombinedSignals
+    quality: Optional[dict] = None
+    # Indicator data the signals were detected on, kept for follow-up analysis
+    enhanced_data: Optional[pd.DataFrame] = field(
+        default=None, repr=False, compare=False
+    )
 
     @property
     def symbol(self) -> str:
@@ -26,11 +37,55 @@ class ScreeningResult:
         return self.signals.has_any_signal
 
 
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
+class ScreeningSummary:
+    """Signal counts for a set of screening results"""
+
+    total_screened: int
+    signal_count: int
+    breakout_count: int
+    volume_spike_count: int
+
+
 class ScreeningResults:
     """Container for multiple screening results with analysis capabilities"""
 
     def __init__(self, results: list[ScreeningResult]):
         self.results = results
+        self._with_signals: Optional[list[ScreeningResult]] = None
+        self._with_breakouts: list[ScreeningResult] = []
+        self._with_volume: list[ScreeningResult] = []
+
+    def _index(self) -> None:
+        """Partition results by signal type in a single pass on first access"""
+        if self._with_signals is not None:
+            return
+        with_signals, with_breakouts, with_volume = [], [], []
+        for result in self.results:
+            self._classify(result, with_signals, with_breakouts, with_volume)
+        self._with_signals = with_signals
+        self._with_breakouts = with_breakouts
+        self._with_volume = with_volume
+
+    @staticmethod
+    def _classify(
+        result: ScreeningResult,
+        with_signals: list[ScreeningResult],
+        with_breakouts: list[ScreeningResult],
+        with_volume: list[ScreeningResult],
+    ) -> None:
+        """Append a result to each signal list it belongs to"""
+        # Resolve each signal flag once instead of walking the attribute chain
+        # for every list
+        signals = result.signals
+        breakout = signals.breakout.signal
+        volume = signals.volume.signal
+        if breakout:
+            with_breakouts.append(result)
+        if volume:
+            with_volume.append(result)
+        if breakout or volume:
+            with_signals.append(result)
 
     @property
     def total_screened(self) -> int:
@@ -40,48 +95,72 @@ class ScreeningResults:
     @property
     def stocks_with_signals(self) -> list[ScreeningResult]:
         """Get stocks that have any signals"""
-        return [result for result in self.results if result.has_signals]
+        self._index()
+        return list(self._with_signals)
 
     @property
     def stocks_with_breakouts(self) -> list[ScreeningResult]:
         """Get stocks with breakout signals"""
-        return [result for result in self.results if result.signals.breakout.signal]
+        self._index()
+        return list(self._with_breakouts)
 
     @property
     def stocks_with_volume_spikes(self) -> list[ScreeningResult]:
         """Get stocks with volume spike signals"""
-        return [result for result in self.results if result.signals.volume.signal]
+        self._index()
+        return list(self._with_volume)
 
     @property
     def breakout_count(self) -> int:
         """Count of stocks with breakout signals"""
-        return len(self.stocks_with_breakouts)
+        self._index()
+        return len(self._with_breakouts)
 
     @property
     def volume_spike_count(self) -> int:
         """Count of stocks with volume spikes"""
-        return len(self.stocks_with_volume_spikes)
+        self._index()
+        return len(self._with_volume)
 
     @property
     def signal_count(self) -> int:
         """Count of stocks with any signals"""
-        return len(self.stocks_with_signals)
+        self._index()
+        return len(self._with_signals)
+
+    def summary(self) -> ScreeningSummary:
+        """Get all signal counts from a single classification pass"""
+        self._index()
+        return ScreeningSummary(
+            total_screened=len(self.results),
+            signal_count=len(self._with_signals),
+            breakout_count=len(self._with_breakouts),
+            volume_spike_count=len(self._with_volume),
+        )
 
     def add_result(self, result: ScreeningResult) -> None:
         """Add a screening result"""
         self.results.append(result)
+        if self._with_signals is not None:
+            self._classify(
+                result, self._with_signals, self._with_breakouts, self._with_volume
+            )
 
     def get_top_signals(self, limit: int = 10) -> list[ScreeningResult]:
         """Get top signals sorted by signal strength and volume"""
-        signal_stocks = self.stocks_with_signals
-
-        # Sort by signal count first, then by breakout strength
-        return sorted(
-            signal_stocks,
-            key=lambda x: (
-                x.signals.signal_count,
-                x.signals.breakout.strength if x.signals.breakout.signal else 0,
-                x.signals.volume.volume_ratio if x.signals.volume.signal else 0,
-            ),
-            reverse=True,
-        )[:limit]
+        self._index()
+
+        # Sort by signal count first, then by breakout strength and volume ratio.
+        # Multiplying by the signal flag zeroes inactive signals without branching.
+        keyed = [
+            (
+                (
+                    result.signals.signal_count,
+                    result.signals.breakout.strength * result.signals.breakout.signal,
+                    result.signals.volume.volume_ratio * result.signals.volume.signal,
+                ),
+                result,
+            )
+            for result in self._with_signals
+        ]
+        return [result for _, result in heapq.nlargest(limit, keyed, key=itemgetter(0))]
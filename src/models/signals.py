@@ -6,6 +6,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 
+from . import DATACLASS_OPTIONS
+
 
 class SignalType(Enum):
     """Types of signals that can be detected"""
@@ -15,7 +17,7 @@ class SignalType(Enum):
     VOLUME_SPIKE = "Volume Spike"
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class BreakoutSignal:
     """Represents a breakout signal"""
 
@@ -41,7 +43,7 @@ class BreakoutSignal:
         return cls(signal=True, signal_type=SignalType.MA_BREAKOUT, strength=strength)
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class VolumeSignal:
     """Represents a volume spike signal"""
 
@@ -59,7 +61,7 @@ class VolumeSignal:
         return cls(signal=True, volume_ratio=volume_ratio)
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class CombinedSignals:
     """Container for all signals detected for a stock"""
 
@@ -69,14 +71,9 @@ class CombinedSignals:
     @property
     def has_any_signal(self) -> bool:
         """Check if any signal is detected"""
-        return self.breakout.signal or self.volume.signal
+        return self.breakout.signal | self.volume.signal
 
     @property
     def signal_count(self) -> int:
         """Count of active signals"""
-        count = 0
-        if self.breakout.signal:
-            count += 1
-        if self.volume.signal:
-            count += 1
-        return count
+        return int(self.breakout.signal) + int(self.volume.signal)
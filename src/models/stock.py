@@ -2,14 +2,17 @@
 Stock data model for representing stock information
 """
 
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
 import pandas as pd
 
+from . import DATACLASS_OPTIONS
 
-@dataclass
+
+@dataclass(**DATACLASS_OPTIONS)
 class StockPrice:
     """Represents current stock price information"""
 
@@ -21,20 +24,24 @@ class StockPrice:
     timestamp: str
 
     @classmethod
-    def from_data(cls, symbol: str, data: pd.DataFrame) -> "StockPrice":
-        """Create StockPrice from pandas DataFrame"""
-        latest = data.iloc[-1]
+    def from_data(
+        cls, symbol: str, data: pd.DataFrame, timestamp: Optional[str] = None
+    ) -> "StockPrice":
+        """Create StockPrice from pandas DataFrame, timestamped now unless given"""
+        # Read the last element of each column directly rather than
+        # materializing the whole final row as a Series
         return cls(
             symbol=symbol,
-            current_price=round(latest["Close"], 2),
-            price_change_pct=round(latest["Price_Change_Pct"] * 100, 2),
-            volume=int(latest["Volume"]),
-            avg_volume=int(latest["Volume_MA_20"]),
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            current_price=round(float(data["Close"].values[-1]), 2),
+            price_change_pct=round(float(data["Price_Change_Pct"].values[-1]) * 100, 2),
+            volume=int(data["Volume"].values[-1]),
+            avg_volume=int(data["Volume_MA_20"].values[-1]),
+            timestamp=timestamp
+            or datetime.now().isoformat(sep=" ", timespec="seconds"),
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class TechnicalIndicators:
     """Technical indicators calculated for stock analysis"""
 
@@ -48,38 +55,53 @@ class TechnicalIndicators:
     @classmethod
     def from_data(cls, data: pd.DataFrame) -> "TechnicalIndicators":
         """Create TechnicalIndicators from pandas DataFrame"""
-        latest = data.iloc[-1]
         return cls(
-            sma_20=latest["SMA_20"],
-            sma_50=latest["SMA_50"],
-            volume_ma_20=latest["Volume_MA_20"],
-            price_volatility=latest["Price_Volatility"],
-            resistance=latest["Resistance"],
-            support=latest["Support"],
+            sma_20=float(data["SMA_20"].values[-1]),
+            sma_50=float(data["SMA_50"].values[-1]),
+            volume_ma_20=float(data["Volume_MA_20"].values[-1]),
+            price_volatility=float(data["Price_Volatility"].values[-1]),
+            resistance=float(data["Resistance"].values[-1]),
+            support=float(data["Support"].values[-1]),
         )
 
 
 class StockData:
     """Container for stock data and calculated indicators"""
 
-    def __init__(self, symbol: str, raw_data: pd.DataFrame):
+    def __init__(
+        self, symbol: str, raw_data: pd.DataFrame, timestamp: Optional[str] = None
+    ):
         self.symbol = symbol
         self.raw_data = raw_data
+        self.timestamp = timestamp
         self._price_info: Optional[StockPrice] = None
         self._technical_indicators: Optional[TechnicalIndicators] = None
+        self._lock = threading.Lock()
+
+    def _ensure_derived(self) -> None:
+        """Build price info and technical indicators together on first access"""
+        # Fast path stays lock-free once both objects have been built
+        if self._technical_indicators is not None:
+            return
+        with self._lock:
+            if self._technical_indicators is None:
+                self._price_info = StockPrice.from_data(
+                    self.symbol, self.raw_data, self.timestamp
+                )
+                self._technical_indicators = TechnicalIndicators.from_data(
+                    self.raw_data
+                )
 
     @property
     def price_info(self) -> StockPrice:
         """Get current price information"""
-        if self._price_info is None:
-            self._price_info = StockPrice.from_data(self.symbol, self.raw_data)
+        self._ensure_derived()
         return self._price_info
 
     @property
     def technical_indicators(self) -> TechnicalIndicators:
         """Get technical indicators"""
-        if self._technical_indicators is None:
-            self._technical_indicators = TechnicalIndicators.from_data(self.raw_data)
+        self._ensure_derived()
         return self._technical_indicators
 
     @property
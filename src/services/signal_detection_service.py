@@ -3,10 +3,18 @@ Signal detection service for identifying trading signals
 """
 
 import logging
+from typing import Optional, Union
 
+import numpy as np
 import pandas as pd
 
-from models.signals import BreakoutSignal, CombinedSignals, VolumeSignal
+from models.signals import BreakoutSignal, CombinedSignals, SignalType, VolumeSignal
+from services.signal_kernels import (
+    SignalColumns,
+    detect_breakout_kernel,
+    detect_combined_kernel,
+    detect_volume_kernel,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,12 +35,14 @@ class SignalDetectionService:
         self.volume_spike_threshold = volume_spike_threshold
         self.breakout_threshold = breakout_threshold
 
-    def detect_all_signals(self, data: pd.DataFrame) -> CombinedSignals:
+    def detect_all_signals(
+        self, data: Union[pd.DataFrame, SignalColumns]
+    ) -> CombinedSignals:
         """
         Detect all signals for the given stock data
 
         Args:
-            data (pd.DataFrame): Stock data with technical indicators
+            data (pd.DataFrame or SignalColumns): Stock data with technical indicators
 
         Returns:
             CombinedSignals: Combined signal results
@@ -40,27 +50,41 @@ class SignalDetectionService:
         try:
             logger.debug("Detecting all signals")
 
-            # Detect breakout signals
-            breakout_signal = self.detect_breakout_signals(data)
-
-            # Detect volume signals
-            volume_signal = self.detect_volume_signals(data)
+            # Extract the indicator columns once for both detectors
+            columns = SignalColumns.of(data)
+            if len(columns) < 21:  # Need enough data for calculations
+                logger.debug("Insufficient data for signal detection")
+                return CombinedSignals(
+                    breakout=BreakoutSignal.no_signal(), volume=VolumeSignal.no_signal()
+                )
+
+            # Detect breakout and volume signals in one pass over the columns
+            breakout_type, breakout_strength, spike_detected, max_ratio, ratios = (
+                detect_combined_kernel(
+                    columns, self.breakout_threshold, self.volume_spike_threshold
+                )
+            )
 
-            return CombinedSignals(breakout=breakout_signal, volume=volume_signal)
+            return CombinedSignals(
+                breakout=self._breakout_signal(breakout_type, breakout_strength),
+                volume=self._volume_signal(spike_detected, max_ratio, ratios),
+            )
 
         except Exception as e:
-            logger.error(f"Error detecting signals: {str(e)}")
+            logger.error("Error detecting signals: %s", e)
             # Return no signals in case of error
             return CombinedSignals(
                 breakout=BreakoutSignal.no_signal(), volume=VolumeSignal.no_signal()
             )
 
-    def detect_breakout_signals(self, data: pd.DataFrame) -> BreakoutSignal:
+    def detect_breakout_signals(
+        self, data: Union[pd.DataFrame, SignalColumns]
+    ) -> BreakoutSignal:
         """
         Detect breakout patterns
 
         Args:
-            data (pd.DataFrame): Stock data with technical indicators
+            data (pd.DataFrame or SignalColumns): Stock data with technical indicators
 
         Returns:
             BreakoutSignal: Breakout signal information
@@ -70,48 +94,23 @@ class SignalDetectionService:
                 logger.debug("Insufficient data for breakout detection")
                 return BreakoutSignal.no_signal()
 
-            latest = data.iloc[-1]
-            previous = data.iloc[-2]
-
-            # Check for both types of breakouts
-            resistance_breakout, resistance_strength = (
-                self._check_resistance_breakout_with_data(data)
+            breakout_type, strength = detect_breakout_kernel(
+                SignalColumns.of(data), self.breakout_threshold
             )
-            ma_breakout, ma_strength = self._check_ma_breakout(latest, previous)
-
-            # Prioritize based on which signal is stronger and more appropriate
-            if resistance_breakout and ma_breakout:
-                # If both are detected, choose based on which is more significant
-                # MA breakout is preferred for gradual trend changes
-                # Resistance breakout is preferred for clear level breaks
-                close_to_resistance = abs(latest["Close"] - latest["Resistance"]) / latest["Resistance"] < 0.05
-                close_to_ma = abs(latest["Close"] - latest["SMA_20"]) / latest["SMA_20"] < 0.05
-                
-                if close_to_resistance and resistance_strength > ma_strength:
-                    logger.info(f"Resistance breakout detected with strength: {resistance_strength:.2%}")
-                    return BreakoutSignal.resistance_breakout(resistance_strength)
-                else:
-                    logger.info(f"MA breakout detected with strength: {ma_strength:.2%}")
-                    return BreakoutSignal.ma_breakout(ma_strength)
-            elif resistance_breakout:
-                logger.info(f"Resistance breakout detected with strength: {resistance_strength:.2%}")
-                return BreakoutSignal.resistance_breakout(resistance_strength)
-            elif ma_breakout:
-                logger.info(f"MA breakout detected with strength: {ma_strength:.2%}")
-                return BreakoutSignal.ma_breakout(ma_strength)
-
-            return BreakoutSignal.no_signal()
+            return self._breakout_signal(breakout_type, strength)
 
         except Exception as e:
-            logger.error(f"Error detecting breakout signals: {str(e)}")
+            logger.error("Error detecting breakout signals: %s", e)
             return BreakoutSignal.no_signal()
 
-    def detect_volume_signals(self, data: pd.DataFrame) -> VolumeSignal:
+    def detect_volume_signals(
+        self, data: Union[pd.DataFrame, SignalColumns]
+    ) -> VolumeSignal:
         """
         Detect volume spikes
 
         Args:
-            data (pd.DataFrame): Stock data with volume information
+            data (pd.DataFrame or SignalColumns): Stock data with volume information
 
         Returns:
             VolumeSignal: Volume spike signal information
@@ -122,44 +121,18 @@ class SignalDetectionService:
                 return VolumeSignal.no_signal()
 
             # Look for volume spikes in recent days (last 5 days)
-            max_volume_ratio = 0.0
-            spike_detected = False
-
-            lookback_days = min(5, len(data))
-
-            for i in range(1, lookback_days + 1):
-                day_data = data.iloc[-i]
-
-                # Calculate volume ratio for this day
-                if day_data["Volume_MA_20"] > 0:
-                    volume_ratio = day_data["Volume"] / day_data["Volume_MA_20"]
-                else:
-                    volume_ratio = 0
-
-                max_volume_ratio = max(max_volume_ratio, volume_ratio)
-
-                # Check for volume spike
-                if volume_ratio >= self.volume_spike_threshold:
-                    spike_detected = True
-                    logger.info(
-                        f"Volume spike detected on recent day: {volume_ratio:.1f}x average"
-                    )
-
-            if spike_detected:
-                return VolumeSignal.volume_spike(max_volume_ratio)
-
-            # If no spike detected, return current day ratio for reference
-            latest = data.iloc[-1]
-            current_ratio = (
-                latest["Volume"] / latest["Volume_MA_20"]
-                if latest["Volume_MA_20"] > 0
-                else 0
+            columns = SignalColumns.of(data)
+            spike_detected, max_volume_ratio, ratios = detect_volume_kernel(
+                columns.volume,
+                columns.volume_ma,
+                self.volume_spike_threshold,
+                min(5, len(data)),
             )
 
-            return VolumeSignal.no_signal(current_ratio)
+            return self._volume_signal(spike_detected, max_volume_ratio, ratios)
 
         except Exception as e:
-            logger.error(f"Error detecting volume signals: {str(e)}")
+            logger.error("Error detecting volume signals: %s", e)
             return VolumeSignal.no_signal()
 
     def _check_resistance_breakout(
@@ -200,127 +173,67 @@ class SignalDetectionService:
             return False, 0.0
 
         except Exception as e:
-            logger.error(f"Error checking resistance breakout: {str(e)}")
+            logger.error("Error checking resistance breakout: %s", e)
             return False, 0.0
 
-    def _check_resistance_breakout_with_data(
-        self, data: pd.DataFrame
-    ) -> tuple[bool, float]:
+    def _breakout_signal(
+        self, breakout_type: Optional[SignalType], strength: float
+    ) -> BreakoutSignal:
         """
-        Check for resistance breakout pattern with full data context
+        Build the breakout signal chosen by the kernels
 
         Args:
-            data (pd.DataFrame): Full stock data with indicators
+            breakout_type (SignalType, optional): Detected breakout type, if any
+            strength (float): Breakout strength
 
         Returns:
-            Tuple[bool, float]: (is_breakout, strength)
+            BreakoutSignal: Breakout signal information
         """
-        try:
-            if len(data) < 10:  # Need enough data for resistance analysis
-                return False, 0.0
-
-            latest = data.iloc[-1]
-
-            # Look for recent volume confirmation (within last 5 days)
-            volume_confirmation = False
-            volume_spike_day = None
-            lookback_days = min(5, len(data))
-
-            for i in range(1, lookback_days + 1):
-                day_data = data.iloc[-i]
-                if day_data["Volume"] > day_data["Volume_MA_20"] * 1.2:
-                    volume_confirmation = True
-                    volume_spike_day = len(data) - i
-                    break
-
-            if not volume_confirmation:
-                return False, 0.0
-
-            # Find the resistance level before the volume spike
-            # Look at resistance 5-10 days before the volume spike
-            if volume_spike_day is None or volume_spike_day < 10:
-                return False, 0.0
-            
-            # Use resistance from before the spike (5-10 days before spike day)
-            pre_spike_start = max(0, volume_spike_day - 10)
-            pre_spike_end = volume_spike_day - 5
-            
-            if pre_spike_end <= pre_spike_start:
-                return False, 0.0
-                
-            pre_spike_resistance = data.iloc[pre_spike_start:pre_spike_end]["Resistance"].max()
-            
-            # Check if current price is above the pre-spike resistance
-            resistance_threshold = pre_spike_resistance * (1 + self.breakout_threshold)
-            current_above_resistance = latest["Close"] > resistance_threshold
-
-            if not current_above_resistance:
-                return False, 0.0
-
-            # Check that price broke above the pre-spike resistance recently
-            recent_breakout = False
-            for i in range(volume_spike_day, min(len(data), volume_spike_day + 5)):
-                if i >= len(data):
-                    break
-                current_day = data.iloc[i]
-                if current_day["Close"] > resistance_threshold:
-                    recent_breakout = True
-                    break
-
-            if recent_breakout and volume_confirmation:
-                # Calculate breakout strength using pre-spike resistance
-                strength = (latest["Close"] - pre_spike_resistance) / pre_spike_resistance
-                return True, max(0, strength)  # Ensure non-negative strength
-
-            return False, 0.0
-
-        except Exception as e:
-            logger.error(f"Error checking resistance breakout with data: {str(e)}")
-            return False, 0.0
-
-    def _check_ma_breakout(
-        self, latest: pd.Series, previous: pd.Series
-    ) -> tuple[bool, float]:
+        if breakout_type is SignalType.RESISTANCE_BREAKOUT:
+            logger.info(
+                "Resistance breakout detected with strength: %.2f%%", strength * 100
+            )
+            return BreakoutSignal.resistance_breakout(strength)
+        if breakout_type is SignalType.MA_BREAKOUT:
+            logger.info("MA breakout detected with strength: %.2f%%", strength * 100)
+            return BreakoutSignal.ma_breakout(strength)
+        return BreakoutSignal.no_signal()
+
+    def _volume_signal(
+        self, spike_detected: bool, max_volume_ratio: float, ratios: np.ndarray
+    ) -> VolumeSignal:
         """
-        Check for moving average breakout pattern
+        Build the volume signal from the kernel results
 
         Args:
-            latest (pd.Series): Latest data point
-            previous (pd.Series): Previous data point
+            spike_detected (bool): Whether a spike was found in the lookback window
+            max_volume_ratio (float): Largest volume ratio in the window
+            ratios (np.ndarray): Volume ratios over the window, oldest first
 
         Returns:
-            Tuple[bool, float]: (is_breakout, strength)
+            VolumeSignal: Volume spike signal information
         """
-        try:
-            # Conditions for MA breakout:
-            # 1. Current price breaks above SMA 20
-            # 2. Previous price was below SMA 20
-            # 3. SMA 20 > SMA 50 (uptrend confirmation)
-
-            price_above_sma = latest["Close"] > latest["SMA_20"]
-            previous_below_sma = previous["Close"] <= previous["SMA_20"]
-            uptrend_confirmation = latest["SMA_20"] > latest["SMA_50"]
-
-            if price_above_sma and previous_below_sma and uptrend_confirmation:
-                # Calculate breakout strength
-                strength = (latest["Close"] - latest["SMA_20"]) / latest["SMA_20"]
-                return True, max(0, strength)  # Ensure non-negative strength
-
-            return False, 0.0
-
-        except Exception as e:
-            logger.error(f"Error checking MA breakout: {str(e)}")
-            return False, 0.0
+        if spike_detected:
+            # Most recent day first, matching the lookback order
+            for volume_ratio in ratios[ratios >= self.volume_spike_threshold][::-1]:
+                logger.info(
+                    "Volume spike detected on recent day: %.1fx average",
+                    volume_ratio,
+                )
+            return VolumeSignal.volume_spike(max_volume_ratio)
+
+        # If no spike detected, return current day ratio for reference
+        return VolumeSignal.no_signal(float(ratios[-1]))
 
     def analyze_signal_quality(
-        self, signals: CombinedSignals, data: pd.DataFrame
+        self, signals: CombinedSignals, data: Union[pd.DataFrame, SignalColumns]
     ) -> dict:
         """
         Analyze the quality and reliability of detected signals
 
         Args:
             signals (CombinedSignals): Detected signals
-            data (pd.DataFrame): Stock data with indicators
+            data (pd.DataFrame or SignalColumns): Stock data with indicators
 
         Returns:
             dict: Signal quality analysis
@@ -329,27 +242,29 @@ class SignalDetectionService:
             if len(data) == 0:
                 return {"quality": "unknown", "confidence": 0.0}
 
-            latest = data.iloc[-1]
+            volume, volume_ma, sma_20, sma_50, price_volatility = (
+                self._latest_quality_inputs(data)
+            )
             quality_score = 0.0
             factors = []
 
             # Volume confirmation
-            if latest["Volume"] > latest["Volume_MA_20"] * 1.5:
+            if volume > volume_ma * 1.5:
                 quality_score += 0.3
                 factors.append("strong_volume")
-            elif latest["Volume"] > latest["Volume_MA_20"]:
+            elif volume > volume_ma:
                 quality_score += 0.15
                 factors.append("good_volume")
 
             # Trend confirmation
-            if latest["SMA_20"] > latest["SMA_50"]:
+            if sma_20 > sma_50:
                 quality_score += 0.2
                 factors.append("uptrend")
 
             # Volatility check (not too volatile)
-            avg_price = latest["SMA_20"]
+            avg_price = sma_20
             if (
-                avg_price > 0 and latest["Price_Volatility"] / avg_price < 0.05
+                avg_price > 0 and price_volatility / avg_price < 0.05
             ):  # Less than 5% volatility
                 quality_score += 0.2
                 factors.append("low_volatility")
@@ -379,5 +294,36 @@ class SignalDetectionService:
             }
 
         except Exception as e:
-            logger.error(f"Error analyzing signal quality: {str(e)}")
+            logger.error("Error analyzing signal quality: %s", e)
             return {"quality": "unknown", "confidence": 0.0}
+
+    @staticmethod
+    def _latest_quality_inputs(
+        data: Union[pd.DataFrame, SignalColumns],
+    ) -> tuple[float, float, float, float, float]:
+        """
+        Read the latest values used for signal quality scoring
+
+        Args:
+            data (pd.DataFrame or SignalColumns): Stock data with indicators
+
+        Returns:
+            Tuple[float, float, float, float, float]: (volume, volume_ma, sma_20,
+                sma_50, price_volatility) for the latest day
+        """
+        if isinstance(data, SignalColumns):
+            return (
+                data.volume[-1],
+                data.volume_ma[-1],
+                data.sma_20[-1],
+                data.sma_50[-1],
+                data.price_volatility[-1],
+            )
+        # Scalar access avoids converting whole columns for one row
+        return (
+            data["Volume"].iat[-1],
+            data["Volume_MA_20"].iat[-1],
+            data["SMA_20"].iat[-1],
+            data["SMA_50"].iat[-1],
+            data["Price_Volatility"].iat[-1],
+        )
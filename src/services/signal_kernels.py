@@ -0,0 +1,313 @@
+"""
+Array kernels for signal detection
+
+Pure NumPy functions operating on float64 column arrays, plus the container
+that extracts those columns from an indicator frame once per stock.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from models import DATACLASS_OPTIONS
+from models.signals import SignalType
+
+
+@dataclass(**DATACLASS_OPTIONS)
+class SignalColumns:
+    """Float64 column arrays used by signal detection, extracted once per frame"""
+
+    close: np.ndarray
+    resistance: np.ndarray
+    volume: np.ndarray
+    volume_ma: np.ndarray
+    sma_20: np.ndarray
+    sma_50: np.ndarray
+    price_volatility: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    @classmethod
+    def of(cls, data: Union[pd.DataFrame, "SignalColumns"]) -> "SignalColumns":
+        """Extract the columns from a frame, passing through existing columns"""
+        if isinstance(data, cls):
+            return data
+        return cls(
+            close=data["Close"].to_numpy(dtype=float),
+            resistance=data["Resistance"].to_numpy(dtype=float),
+            volume=data["Volume"].to_numpy(dtype=float),
+            volume_ma=data["Volume_MA_20"].to_numpy(dtype=float),
+            sma_20=data["SMA_20"].to_numpy(dtype=float),
+            sma_50=data["SMA_50"].to_numpy(dtype=float),
+            price_volatility=data["Price_Volatility"].to_numpy(dtype=float),
+        )
+
+    def head(self, n: int) -> "SignalColumns":
+        """
+        Return the first n days as views of the same arrays (like DataFrame.head)
+
+        Args:
+            n (int): Number of leading days to keep
+
+        Returns:
+            SignalColumns: Columns limited to the first n days
+        """
+        return SignalColumns(
+            **{field.name: getattr(self, field.name)[:n] for field in fields(self)}
+        )
+
+
+def volume_ratios(volume: np.ndarray, volume_ma: np.ndarray) -> np.ndarray:
+    """
+    Compute volume to average-volume ratios
+
+    Args:
+        volume (np.ndarray): Daily volumes
+        volume_ma (np.ndarray): Average volumes aligned with volume
+
+    Returns:
+        np.ndarray: Ratio per day, 0 where there is no positive average
+    """
+    return np.divide(volume, volume_ma, out=np.zeros_like(volume), where=volume_ma > 0)
+
+
+def detect_volume_kernel(
+    volume: np.ndarray, volume_ma: np.ndarray, threshold: float, lookback: int
+) -> tuple[bool, float, np.ndarray]:
+    """
+    Detect a volume spike within the last lookback days
+
+    Args:
+        volume (np.ndarray): Daily volumes
+        volume_ma (np.ndarray): 20-day average volumes
+        threshold (float): Volume ratio that counts as a spike
+        lookback (int): Number of most recent days to examine
+
+    Returns:
+        Tuple[bool, float, np.ndarray]: (spike_detected, max_ratio, ratios) where
+            ratios covers the lookback window in chronological order
+    """
+    ratios = volume_ratios(volume[-lookback:], volume_ma[-lookback:])
+    spike_detected = bool((ratios >= threshold).any())
+    # fmax ignores NaN ratios, as the running max over the window did
+    max_ratio = float(np.fmax.reduce(ratios, initial=0.0))
+    return spike_detected, max_ratio, ratios
+
+
+def detect_resistance_breakout_kernel(
+    close: np.ndarray,
+    resistance: np.ndarray,
+    volume: np.ndarray,
+    volume_ma: np.ndarray,
+    threshold: float,
+) -> tuple[bool, float]:
+    """
+    Detect a breakout above the resistance level preceding a recent volume spike
+
+    Args:
+        close (np.ndarray): Closing prices
+        resistance (np.ndarray): Rolling resistance levels
+        volume (np.ndarray): Daily volumes
+        volume_ma (np.ndarray): 20-day average volumes
+        threshold (float): Fraction the close must clear the resistance by
+
+    Returns:
+        Tuple[bool, float]: (is_breakout, strength)
+    """
+    size = len(close)
+    if size < 10:  # Need enough data for resistance analysis
+        return False, 0.0
+
+    lookback = min(5, size)
+    confirmed = volume[-lookback:] > volume_ma[-lookback:] * 1.2
+    return _resistance_breakout_after_spike(close, resistance, confirmed, threshold)
+
+
+def _resistance_breakout_after_spike(
+    close: np.ndarray,
+    resistance: np.ndarray,
+    confirmed: np.ndarray,
+    threshold: float,
+) -> tuple[bool, float]:
+    """
+    Detect a resistance breakout given the volume-confirmed days of the tail
+
+    Args:
+        close (np.ndarray): Closing prices
+        resistance (np.ndarray): Rolling resistance levels
+        confirmed (np.ndarray): Per-day volume confirmation for the last days
+        threshold (float): Fraction the close must clear the resistance by
+
+    Returns:
+        Tuple[bool, float]: (is_breakout, strength)
+    """
+    # Most recent day within the tail with volume above 1.2x average
+    confirmed_days = np.flatnonzero(confirmed)
+    if len(confirmed_days) == 0:
+        return False, 0.0
+    size = len(close)
+    spike_day = size - len(confirmed) + int(confirmed_days[-1])
+
+    # Resistance from 5-10 days before the volume spike
+    if spike_day < 10:
+        return False, 0.0
+    pre_spike_window = resistance[spike_day - 10 : spike_day - 5]
+    if np.isnan(pre_spike_window).all():
+        return False, 0.0
+    pre_spike_resistance = float(np.nanmax(pre_spike_window))
+
+    # Current price must be above the pre-spike resistance, having broken
+    # through it within 5 days of the spike
+    resistance_threshold = pre_spike_resistance * (1 + threshold)
+    if not close[-1] > resistance_threshold:
+        return False, 0.0
+    if not (close[spike_day : spike_day + 5] > resistance_threshold).any():
+        return False, 0.0
+
+    strength = (close[-1] - pre_spike_resistance) / pre_spike_resistance
+    return True, max(0.0, float(strength))
+
+
+def detect_ma_breakout_kernel(
+    close_now: float,
+    close_prev: float,
+    sma20_now: float,
+    sma20_prev: float,
+    sma50_now: float,
+) -> tuple[bool, float]:
+    """
+    Detect a close crossing above the 20-day SMA during an uptrend
+
+    Args:
+        close_now (float): Latest closing price
+        close_prev (float): Previous closing price
+        sma20_now (float): Latest 20-day SMA
+        sma20_prev (float): Previous 20-day SMA
+        sma50_now (float): Latest 50-day SMA
+
+    Returns:
+        Tuple[bool, float]: (is_breakout, strength)
+    """
+    if close_now > sma20_now and close_prev <= sma20_prev and sma20_now > sma50_now:
+        strength = (close_now - sma20_now) / sma20_now
+        return True, max(0.0, float(strength))
+    return False, 0.0
+
+
+def select_breakout(
+    resistance_result: tuple[bool, float],
+    ma_result: tuple[bool, float],
+    close_now: float,
+    resistance_now: float,
+) -> tuple[Optional[SignalType], float]:
+    """
+    Choose between a resistance and a moving average breakout
+
+    Args:
+        resistance_result (Tuple[bool, float]): Resistance breakout and strength
+        ma_result (Tuple[bool, float]): MA breakout and strength
+        close_now (float): Latest closing price
+        resistance_now (float): Latest resistance level
+
+    Returns:
+        Tuple[Optional[SignalType], float]: (breakout type or None, strength)
+    """
+    resistance_breakout, resistance_strength = resistance_result
+    ma_breakout, ma_strength = ma_result
+
+    if resistance_breakout and ma_breakout:
+        # If both are detected, choose based on which is more significant
+        # MA breakout is preferred for gradual trend changes
+        # Resistance breakout is preferred for clear level breaks
+        close_to_resistance = abs(close_now - resistance_now) / resistance_now < 0.05
+        if close_to_resistance and resistance_strength > ma_strength:
+            return SignalType.RESISTANCE_BREAKOUT, resistance_strength
+        return SignalType.MA_BREAKOUT, ma_strength
+    if resistance_breakout:
+        return SignalType.RESISTANCE_BREAKOUT, resistance_strength
+    if ma_breakout:
+        return SignalType.MA_BREAKOUT, ma_strength
+    return None, 0.0
+
+
+def _ma_breakout(columns: SignalColumns) -> tuple[bool, float]:
+    """Detect a moving average breakout on the last two days of the columns"""
+    close, sma_20 = columns.close, columns.sma_20
+    return detect_ma_breakout_kernel(
+        float(close[-1]),
+        float(close[-2]),
+        float(sma_20[-1]),
+        float(sma_20[-2]),
+        float(columns.sma_50[-1]),
+    )
+
+
+def detect_breakout_kernel(
+    columns: SignalColumns, threshold: float
+) -> tuple[Optional[SignalType], float]:
+    """
+    Detect the preferred breakout signal, assuming at least 21 days of data
+
+    Args:
+        columns (SignalColumns): Indicator columns
+        threshold (float): Fraction the close must clear the resistance by
+
+    Returns:
+        Tuple[Optional[SignalType], float]: (breakout type or None, strength)
+    """
+    resistance_result = detect_resistance_breakout_kernel(
+        columns.close,
+        columns.resistance,
+        columns.volume,
+        columns.volume_ma,
+        threshold,
+    )
+    return select_breakout(
+        resistance_result,
+        _ma_breakout(columns),
+        columns.close[-1],
+        columns.resistance[-1],
+    )
+
+
+def detect_combined_kernel(
+    columns: SignalColumns,
+    breakout_threshold: float,
+    volume_threshold: float,
+    lookback: int = 5,
+) -> tuple[Optional[SignalType], float, bool, float, np.ndarray]:
+    """
+    Detect breakout and volume signals in one pass over the volume tail,
+    assuming at least 21 days of data
+
+    Args:
+        columns (SignalColumns): Indicator columns
+        breakout_threshold (float): Fraction the close must clear the resistance by
+        volume_threshold (float): Volume ratio that counts as a spike
+        lookback (int): Number of most recent days to examine
+
+    Returns:
+        Tuple: (breakout type or None, breakout strength, spike_detected,
+            max_ratio, ratios) where ratios covers the lookback window
+    """
+    volume_tail = columns.volume[-lookback:]
+    volume_ma_tail = columns.volume_ma[-lookback:]
+
+    # Volume spike and breakout volume confirmation share the same tail
+    spike_detected, max_ratio, ratios = detect_volume_kernel(
+        volume_tail, volume_ma_tail, volume_threshold, lookback
+    )
+    confirmed = volume_tail > volume_ma_tail * 1.2
+    resistance_result = _resistance_breakout_after_spike(
+        columns.close, columns.resistance, confirmed, breakout_threshold
+    )
+    breakout_type, strength = select_breakout(
+        resistance_result,
+        _ma_breakout(columns),
+        columns.close[-1],
+        columns.resistance[-1],
+    )
+    return breakout_type, strength, spike_detected, max_ratio, ratios
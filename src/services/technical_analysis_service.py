@@ -2,20 +2,297 @@
 Technical analysis service for calculating technical indicators
 """
 
+import hashlib
 import logging
-from typing import Any
+import threading
+from collections import OrderedDict, deque
+from typing import Any, Callable, Optional
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
 logger = logging.getLogger(__name__)
 
+# Columns a new bar must provide for an incremental indicator update
+_OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+# (result key, indicator column) pairs reported by get_latest_indicators
+_LATEST_INDICATOR_COLUMNS = (
+    ("sma_20", "SMA_20"),
+    ("sma_50", "SMA_50"),
+    ("volume_ma_20", "Volume_MA_20"),
+    ("price_volatility", "Price_Volatility"),
+    ("resistance", "Resistance"),
+    ("support", "Support"),
+    ("atr", "ATR"),
+    ("obv", "OBV"),
+    ("price_change_pct", "Price_Change_Pct"),
+    ("price_vs_sma20", "Price_vs_SMA20"),
+    ("price_vs_sma50", "Price_vs_SMA50"),
+)
+
+
+def _rolling(
+    values: np.ndarray,
+    window: int,
+    reducer: Callable[..., np.ndarray],
+    **kwargs: Any,
+) -> np.ndarray:
+    """
+    Reduce each trailing window of values in one vectorized call
+
+    Matches pandas rolling(window) with default min_periods: NaN until the
+    window is full and wherever the window contains a NaN.
+
+    Args:
+        values (np.ndarray): Float64 input values
+        window (int): Window length
+        reducer (Callable): NumPy reduction such as np.mean or np.max
+        **kwargs: Extra arguments for the reducer (e.g. ddof)
+
+    Returns:
+        np.ndarray: Reduced value per row, aligned with values
+    """
+    result = np.full(len(values), np.nan)
+    if len(values) >= window:
+        windows = sliding_window_view(values, window)
+        result[window - 1 :] = reducer(windows, axis=1, **kwargs)
+    return result
+
+
+def _content_key(data: pd.DataFrame) -> Optional[bytes]:
+    """
+    Digest of a frame's index, columns, dtypes and values, used as a cache key
+
+    Args:
+        data (pd.DataFrame): Frame to fingerprint
+
+    Returns:
+        bytes: 16-byte digest, or None for frames with non-numeric data
+    """
+    index = data.index
+    # Datetime indexes hash by their int64 nanoseconds (timezone is in the dtype)
+    index_values = (
+        index.asi8 if isinstance(index, pd.DatetimeIndex) else index.to_numpy()
+    )
+    values = data.to_numpy()
+    if index_values.dtype.hasobject or values.dtype.hasobject:
+        return None
+
+    digest = hashlib.blake2b(digest_size=16)
+    header = (
+        list(data.columns),
+        [str(dtype) for dtype in data.dtypes],
+        str(index.dtype),
+    )
+    digest.update(repr(header).encode())
+    for array in (index_values, values):
+        digest.update(np.ascontiguousarray(array).view(np.uint8))
+    return digest.digest()
+
+
+def _diff(values: np.ndarray) -> np.ndarray:
+    """Change from the previous value, NaN first (like diff())"""
+    result = np.empty(len(values))
+    result[:1] = np.nan
+    np.subtract(values[1:], values[:-1], out=result[1:])
+    return result
+
+
+def _pct_change(values: np.ndarray, diff: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Fractional change from the previous value, NaN first (like pct_change())
+
+    Args:
+        values (np.ndarray): Float64 input values
+        diff (np.ndarray, optional): _diff(values), when already computed
+
+    Returns:
+        np.ndarray: Change divided by the previous value
+    """
+    result = _diff(values) if diff is None else diff.copy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(result[1:], values[:-1], out=result[1:])
+    return result
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling mean from a cumulative sum, O(N) regardless of the window length
+
+    NaNs are excluded from the running sum and counted separately, so a
+    window containing one is NaN (matching pandas rolling(window).mean())
+    without poisoning every later window.
+
+    Args:
+        values (np.ndarray): Float64 input values
+        window (int): Window length
+
+    Returns:
+        np.ndarray: Rolling mean per row, NaN until the window is full
+    """
+    size = len(values)
+    result = np.full(size, np.nan)
+    if size < window:
+        return result
+
+    missing = np.isnan(values)
+    sums = np.zeros(size + 1)
+    np.cumsum(np.where(missing, 0.0, values), out=sums[1:])
+    missing_counts = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(missing, out=missing_counts[1:])
+
+    means = (sums[window:] - sums[:-window]) / window
+    means[missing_counts[window:] - missing_counts[:-window] > 0] = np.nan
+    result[window - 1 :] = means
+    return result
+
+
+def _rolling_extreme(values: np.ndarray, window: int, ufunc: np.ufunc) -> np.ndarray:
+    """
+    Rolling maximum or minimum in O(N) regardless of the window length
+
+    Uses the van Herk/Gil-Werman scheme: split values into window-sized
+    blocks, take running extremes forward and backward within each block,
+    and combine the backward value at a window's start with the forward
+    value at its end. NaN handling matches pandas rolling(window).max()/min().
+
+    Args:
+        values (np.ndarray): Float64 input values
+        window (int): Window length
+        ufunc (np.ufunc): np.maximum or np.minimum
+
+    Returns:
+        np.ndarray: Rolling extreme per row, NaN until the window is full
+    """
+    size = len(values)
+    result = np.full(size, np.nan)
+    if size < window:
+        return result
+
+    # Pad the last block with the identity of the extreme so it never wins
+    fill = -np.inf if ufunc is np.maximum else np.inf
+    blocks = -(-size // window)
+    padded = np.full(blocks * window, fill)
+    padded[:size] = values
+    grid = padded.reshape(blocks, window)
+
+    forward = ufunc.accumulate(grid, axis=1).ravel()
+    backward = ufunc.accumulate(grid[:, ::-1], axis=1)[:, ::-1].ravel()
+    result[window - 1 :] = ufunc(
+        backward[: size - window + 1], forward[window - 1 : size]
+    )
+    return result
+
+
+def _true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """
+    True range per bar, NaN for the first bar (it has no previous close)
+
+    Args:
+        high (np.ndarray): Daily highs
+        low (np.ndarray): Daily lows
+        close (np.ndarray): Daily closes
+
+    Returns:
+        np.ndarray: Largest of high-low, |high-prev close| and |low-prev close|
+    """
+    # The three candidate ranges are written into one buffer and reduced once
+    ranges = np.empty((3, len(high)))
+    np.subtract(high, low, out=ranges[0])
+    ranges[1:, :1] = np.nan
+    np.subtract(high[1:], close[:-1], out=ranges[1, 1:])
+    np.subtract(low[1:], close[:-1], out=ranges[2, 1:])
+    np.abs(ranges[1:], out=ranges[1:])
+    return np.maximum.reduce(ranges, axis=0)
+
+
+def _window_mean(values: deque, window: int) -> float:
+    """Mean of a full window, NaN until the window fills (like rolling().mean())"""
+    if len(values) < window:
+        return np.nan
+    return float(np.mean(values))
+
+
+class _EmaState:
+    """Running numerator/denominator of an adjusted exponential moving average"""
+
+    def __init__(self, span: int, last_value: float, length: int):
+        self.decay = 1 - 2 / (span + 1)
+        # With no missing values, the adjusted EMA's weight total after n
+        # samples is the geometric series 1 + d + ... + d^(n-1)
+        self.denominator = (1 - self.decay**length) / (1 - self.decay)
+        self.numerator = last_value * self.denominator
+
+    def update(self, value: float) -> float:
+        self.numerator = value + self.decay * self.numerator
+        self.denominator = 1 + self.decay * self.denominator
+        return self.numerator / self.denominator
+
+
+class IncrementalIndicatorState:
+    """Rolling-window state for extending an indicator frame one bar at a time"""
+
+    def __init__(self, enhanced_data: pd.DataFrame):
+        close = enhanced_data["Close"].to_numpy(dtype=float)
+        high = enhanced_data["High"].to_numpy(dtype=float)
+        low = enhanced_data["Low"].to_numpy(dtype=float)
+
+        self.enhanced_data = enhanced_data
+        self.length = len(enhanced_data)
+        self.last_index = enhanced_data.index[-1]
+
+        self.closes = deque(close[-50:], maxlen=50)
+        self.volumes = deque(
+            enhanced_data["Volume"].to_numpy(dtype=float)[-20:], maxlen=20
+        )
+        self.highs = deque(high[-20:], maxlen=20)
+        self.lows = deque(low[-20:], maxlen=20)
+
+        # True ranges behind the 14-day ATR
+        self.true_ranges = deque(_true_range(high, low, close)[-14:], maxlen=14)
+
+        self.ema_12 = _EmaState(
+            12, float(enhanced_data["EMA_12"].iloc[-1]), self.length
+        )
+        self.ema_26 = _EmaState(
+            26, float(enhanced_data["EMA_26"].iloc[-1]), self.length
+        )
+        self.obv = float(enhanced_data["OBV"].iloc[-1])
+
+    def can_extend(self, raw_data: pd.DataFrame) -> bool:
+        """Check whether raw_data is the tracked data plus exactly one new bar"""
+        if (
+            len(raw_data) != self.length + 1
+            or raw_data.index[-2] != self.last_index
+            or not np.isfinite(raw_data[_OHLCV_COLUMNS].iloc[-1].to_numpy(float)).all()
+        ):
+            return False
+        # The tracked bars must be unchanged: a revised price (a correction or
+        # dividend re-adjustment) invalidates the windows and running sums
+        return raw_data.index[:-1].equals(self.enhanced_data.index) and np.array_equal(
+            raw_data[_OHLCV_COLUMNS].iloc[:-1].to_numpy(float),
+            self.enhanced_data[_OHLCV_COLUMNS].to_numpy(float),
+        )
+
 
 class TechnicalAnalysisService:
     """Service for calculating technical indicators"""
 
-    def __init__(self):
-        pass
+    def __init__(self, cache_size: int = 32):
+        """
+        Initialize technical analysis service
+
+        Args:
+            cache_size (int): Number of recent indicator results kept for
+                identical input data (0 disables the cache); kept small since
+                the screener shares one service for the life of the process
+        """
+        self.cache_size = cache_size
+        # Content digest of the input -> calculated indicators, oldest first
+        self._cache: OrderedDict[bytes, pd.DataFrame] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def calculate_all_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -27,26 +304,65 @@ class TechnicalAnalysisService:
         Returns:
             pd.DataFrame: Data with additional technical indicators
         """
+        key = _content_key(data) if self.cache_size > 0 else None
+        if key is not None:
+            with self._cache_lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+            if cached is not None:
+                logger.debug("Reusing technical indicators for identical data")
+                # Callers may modify the result, so never hand out the cached frame
+                return cached.copy()
+
+        enhanced_data = self._calculate_all_indicators(data)
+
+        if key is not None:
+            with self._cache_lock:
+                self._cache[key] = enhanced_data.copy()
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return enhanced_data
+
+    def _calculate_all_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Calculate all technical indicators without consulting the cache"""
         try:
             logger.debug("Calculating technical indicators")
 
-            # Make a copy to avoid modifying original data
-            enhanced_data = data.copy()
+            # Build every indicator column first and attach them in one batch;
+            # inserting columns one at a time rebuilds the frame's internals.
+            # Indicators stay float64: frames are a few thousand rows at most,
+            # so the work is per-call overhead rather than memory bandwidth, and
+            # float32 would lose whole shares in OBV/volume sums and shift the
+            # close-vs-level comparisons the signals are built on
+            indicators: dict[str, np.ndarray] = {}
+
+            # Day-over-day close changes feed both OBV and the price change
+            close_diff = _diff(data["Close"].to_numpy(dtype=np.float64))
 
             # Calculate moving averages
-            enhanced_data = self._calculate_moving_averages(enhanced_data)
+            indicators.update(self._calculate_moving_averages(data))
 
             # Calculate volume indicators
-            enhanced_data = self._calculate_volume_indicators(enhanced_data)
+            indicators.update(self._calculate_volume_indicators(data, close_diff))
 
             # Calculate volatility measures
-            enhanced_data = self._calculate_volatility(enhanced_data)
+            indicators.update(self._calculate_volatility(data))
 
             # Calculate support and resistance levels
-            enhanced_data = self._calculate_support_resistance(enhanced_data)
+            indicators.update(self._calculate_support_resistance(data))
 
             # Calculate price change percentages
-            enhanced_data = self._calculate_price_changes(enhanced_data)
+            indicators.update(
+                self._calculate_price_changes(data, indicators, close_diff)
+            )
+
+            # Recalculated indicators replace any the input already carried
+            existing = [column for column in data.columns if column in indicators]
+            base = data.drop(columns=existing) if existing else data
+            enhanced_data = pd.concat(
+                [base, pd.DataFrame(indicators, index=data.index)], axis=1
+            )
 
             logger.debug("Technical indicators calculated successfully")
             return enhanced_data
@@ -55,121 +371,228 @@ class TechnicalAnalysisService:
             logger.error(f"Error calculating technical indicators: {str(e)}")
             raise
 
-    def _calculate_moving_averages(self, data: pd.DataFrame) -> pd.DataFrame:
+    def _calculate_moving_averages(self, data: pd.DataFrame) -> dict[str, np.ndarray]:
         """Calculate simple moving averages"""
-        try:
+        close_series = data["Close"]
+        close = close_series.to_numpy(dtype=np.float64)
+        return {
             # Simple Moving Averages
-            data["SMA_20"] = data["Close"].rolling(window=20).mean()
-            data["SMA_50"] = data["Close"].rolling(window=50).mean()
-
-            # Exponential Moving Averages (optional for future use)
-            data["EMA_12"] = data["Close"].ewm(span=12).mean()
-            data["EMA_26"] = data["Close"].ewm(span=26).mean()
-
-            return data
-        except Exception as e:
-            logger.error(f"Error calculating moving averages: {str(e)}")
-            raise
-
-    def _calculate_volume_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
+            "SMA_20": _rolling_mean(close, 20),
+            "SMA_50": _rolling_mean(close, 50),
+            # Exponential Moving Averages (optional for future use). These
+            # stay on pandas: its compiled single pass implements the
+            # adjusted, NaN-aware EWM that the incremental state mirrors,
+            # which the plain y += alpha * (x - y) recursion does not
+            "EMA_12": close_series.ewm(span=12).mean().to_numpy(),
+            "EMA_26": close_series.ewm(span=26).mean().to_numpy(),
+        }
+
+    def _calculate_volume_indicators(
+        self, data: pd.DataFrame, close_diff: Optional[np.ndarray] = None
+    ) -> dict[str, np.ndarray]:
         """Calculate volume-based indicators"""
-        try:
+        volume = data["Volume"].to_numpy(dtype=np.float64)
+        return {
             # Volume moving average
-            data["Volume_MA_20"] = data["Volume"].rolling(window=20).mean()
-
+            "Volume_MA_20": _rolling_mean(volume, 20),
             # Volume Rate of Change
-            data["Volume_ROC"] = data["Volume"].pct_change()
-
+            "Volume_ROC": _pct_change(volume),
             # On-Balance Volume (OBV)
-            data["OBV"] = self._calculate_obv(data)
-
-            return data
-        except Exception as e:
-            logger.error(f"Error calculating volume indicators: {str(e)}")
-            raise
+            "OBV": self._calculate_obv(data, close_diff).to_numpy(),
+        }
 
-    def _calculate_volatility(self, data: pd.DataFrame) -> pd.DataFrame:
+    def _calculate_volatility(self, data: pd.DataFrame) -> dict[str, np.ndarray]:
         """Calculate volatility measures"""
-        try:
+        close = data["Close"].to_numpy(dtype=np.float64)
+        return {
             # Price volatility (standard deviation)
-            data["Price_Volatility"] = data["Close"].rolling(window=20).std()
-
+            "Price_Volatility": _rolling(close, 20, np.std, ddof=1),
             # Average True Range (ATR)
-            data["ATR"] = self._calculate_atr(data)
+            "ATR": self._calculate_atr(data).to_numpy(),
+        }
 
-            return data
-        except Exception as e:
-            logger.error(f"Error calculating volatility: {str(e)}")
-            raise
-
-    def _calculate_support_resistance(self, data: pd.DataFrame) -> pd.DataFrame:
+    def _calculate_support_resistance(
+        self, data: pd.DataFrame
+    ) -> dict[str, np.ndarray]:
         """Calculate support and resistance levels"""
-        try:
+        high = data["High"].to_numpy(dtype=np.float64)
+        low = data["Low"].to_numpy(dtype=np.float64)
+        close = data["Close"].to_numpy(dtype=np.float64)
+        return {
             # Rolling maximum (resistance) and minimum (support)
-            data["Resistance"] = data["High"].rolling(window=20).max()
-            data["Support"] = data["Low"].rolling(window=20).min()
-
+            "Resistance": _rolling_extreme(high, 20, np.maximum),
+            "Support": _rolling_extreme(low, 20, np.minimum),
             # Pivot points (optional for future use)
-            data["Pivot"] = (data["High"] + data["Low"] + data["Close"]) / 3
-
-            return data
-        except Exception as e:
-            logger.error(f"Error calculating support/resistance: {str(e)}")
-            raise
-
-    def _calculate_price_changes(self, data: pd.DataFrame) -> pd.DataFrame:
+            "Pivot": (high + low + close) / 3,
+        }
+
+    def _calculate_price_changes(
+        self,
+        data: pd.DataFrame,
+        indicators: dict[str, np.ndarray],
+        close_diff: Optional[np.ndarray] = None,
+    ) -> dict[str, np.ndarray]:
         """Calculate price change percentages and ratios"""
-        try:
+        close = data["Close"].to_numpy(dtype=np.float64)
+        changes = {
             # Daily price change percentage
-            data["Price_Change_Pct"] = data["Close"].pct_change()
-
-            # Price change from SMA
-            data["Price_vs_SMA20"] = (data["Close"] - data["SMA_20"]) / data["SMA_20"]
-            data["Price_vs_SMA50"] = (data["Close"] - data["SMA_50"]) / data["SMA_50"]
-
-            return data
-        except Exception as e:
-            logger.error(f"Error calculating price changes: {str(e)}")
-            raise
-
-    def _calculate_obv(self, data: pd.DataFrame) -> pd.Series:
+            "Price_Change_Pct": _pct_change(close, close_diff),
+        }
+
+        # Price change from SMA, dividing in place into the difference
+        for column, sma_column in (
+            ("Price_vs_SMA20", "SMA_20"),
+            ("Price_vs_SMA50", "SMA_50"),
+        ):
+            sma = indicators[sma_column]
+            ratio = np.subtract(close, sma)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                np.divide(ratio, sma, out=ratio)
+            changes[column] = ratio
+
+        return changes
+
+    def _calculate_obv(
+        self, data: pd.DataFrame, close_diff: Optional[np.ndarray] = None
+    ) -> pd.Series:
         """Calculate On-Balance Volume"""
-        try:
-            obv = np.zeros(len(data))
+        volume = data["Volume"].to_numpy(dtype=np.float64)
 
-            for i in range(1, len(data)):
-                if data["Close"].iloc[i] > data["Close"].iloc[i - 1]:
-                    obv[i] = obv[i - 1] + data["Volume"].iloc[i]
-                elif data["Close"].iloc[i] < data["Close"].iloc[i - 1]:
-                    obv[i] = obv[i - 1] - data["Volume"].iloc[i]
-                else:
-                    obv[i] = obv[i - 1]
+        # Day-over-day close change, NaN for the first day
+        diff = close_diff
+        if diff is None:
+            diff = _diff(data["Close"].to_numpy(dtype=np.float64))
 
-            return pd.Series(obv, index=data.index)
-        except Exception as e:
-            logger.error(f"Error calculating OBV: {str(e)}")
-            return pd.Series(np.zeros(len(data)), index=data.index)
+        # Add volume on up days and subtract it on down days; unchanged
+        # (or NaN) closes, including the first day, leave OBV as it was
+        signed_volume = np.where(diff > 0, volume, np.where(diff < 0, -volume, 0.0))
+        return pd.Series(np.cumsum(signed_volume), index=data.index)
 
     def _calculate_atr(self, data: pd.DataFrame, window: int = 14) -> pd.Series:
         """Calculate Average True Range"""
-        try:
-            # True Range calculation
-            high_low = data["High"] - data["Low"]
-            high_close_prev = np.abs(data["High"] - data["Close"].shift(1))
-            low_close_prev = np.abs(data["Low"] - data["Close"].shift(1))
+        high = data["High"].to_numpy(dtype=np.float64)
+        low = data["Low"].to_numpy(dtype=np.float64)
+        close = data["Close"].to_numpy(dtype=np.float64)
 
-            true_range = np.maximum(
-                high_low, np.maximum(high_close_prev, low_close_prev)
-            )
+        # Average True Range
+        true_range = _true_range(high, low, close)
+        return pd.Series(_rolling_mean(true_range, window), index=data.index)
 
-            # Average True Range
-            atr = pd.Series(true_range).rolling(window=window).mean()
-            atr.index = data.index
+    def create_indicator_state(
+        self, enhanced_data: pd.DataFrame
+    ) -> Optional[IncrementalIndicatorState]:
+        """
+        Capture the state needed to update indicators incrementally
 
-            return atr
-        except Exception as e:
-            logger.error(f"Error calculating ATR: {str(e)}")
-            return pd.Series(np.zeros(len(data)), index=data.index)
+        Args:
+            enhanced_data (pd.DataFrame): Data with calculated indicators
+
+        Returns:
+            IncrementalIndicatorState: Update state, or None if the data has gaps
+                that rule out incremental updates
+        """
+        if (
+            len(enhanced_data) == 0
+            or not np.isfinite(
+                enhanced_data[_OHLCV_COLUMNS].to_numpy(dtype=float)
+            ).all()
+        ):
+            return None
+        return IncrementalIndicatorState(enhanced_data)
+
+    def update_one(
+        self, state: IncrementalIndicatorState, new_row: pd.Series
+    ) -> dict[str, float]:
+        """
+        Compute indicators for one new bar in constant time, advancing the state
+
+        Args:
+            state (IncrementalIndicatorState): State for the preceding bars
+            new_row (pd.Series): OHLCV values of the new bar
+
+        Returns:
+            Dict[str, float]: Indicator values for the new bar
+        """
+        close = float(new_row["Close"])
+        high = float(new_row["High"])
+        low = float(new_row["Low"])
+        volume = float(new_row["Volume"])
+        prev_close = state.closes[-1]
+        prev_volume = state.volumes[-1]
+
+        state.closes.append(close)
+        state.volumes.append(volume)
+        state.highs.append(high)
+        state.lows.append(low)
+        state.true_ranges.append(
+            max(high - low, abs(high - prev_close), abs(low - prev_close))
+        )
+
+        if close > prev_close:
+            state.obv += volume
+        elif close < prev_close:
+            state.obv -= volume
+
+        recent_closes = list(state.closes)[-20:]
+        sma_20 = _window_mean(recent_closes, 20)
+        sma_50 = _window_mean(state.closes, 50)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            volume_roc = float((np.float64(volume) - prev_volume) / prev_volume)
+
+        return {
+            "SMA_20": sma_20,
+            "SMA_50": sma_50,
+            "EMA_12": state.ema_12.update(close),
+            "EMA_26": state.ema_26.update(close),
+            "Volume_MA_20": _window_mean(state.volumes, 20),
+            "Volume_ROC": volume_roc,
+            "OBV": state.obv,
+            "Price_Volatility": (
+                float(np.std(recent_closes, ddof=1))
+                if len(recent_closes) == 20
+                else np.nan
+            ),
+            "ATR": _window_mean(state.true_ranges, 14),
+            "Resistance": (
+                float(np.max(state.highs)) if len(state.highs) == 20 else np.nan
+            ),
+            "Support": float(np.min(state.lows)) if len(state.lows) == 20 else np.nan,
+            "Pivot": (high + low + close) / 3,
+            "Price_Change_Pct": (close - prev_close) / prev_close,
+            "Price_vs_SMA20": (close - sma_20) / sma_20,
+            "Price_vs_SMA50": (close - sma_50) / sma_50,
+        }
+
+    def extend_indicators(
+        self, state: IncrementalIndicatorState, raw_data: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        Append indicators for the newest bar of raw_data to the tracked frame
+
+        Args:
+            state (IncrementalIndicatorState): State for all but the last bar
+            raw_data (pd.DataFrame): Raw OHLCV data with one bar more than the state
+
+        Returns:
+            pd.DataFrame: Data with technical indicators, including the new bar
+        """
+        new_row = raw_data.iloc[-1]
+        values = self.update_one(state, new_row)
+
+        previous = state.enhanced_data
+        row = {
+            column: [values[column] if column in values else new_row[column]]
+            for column in previous.columns
+        }
+        new_frame = pd.DataFrame(row, index=raw_data.index[-1:]).astype(
+            previous.dtypes.to_dict()
+        )
+        enhanced_data = pd.concat([previous, new_frame])
+
+        state.enhanced_data = enhanced_data
+        state.length = len(enhanced_data)
+        state.last_index = enhanced_data.index[-1]
+        return enhanced_data
 
     def get_latest_indicators(self, data: pd.DataFrame) -> dict[str, Any]:
         """
@@ -185,24 +608,14 @@ class TechnicalAnalysisService:
             if len(data) == 0:
                 return {}
 
-            latest = data.iloc[-1]
-
-            indicators = {
-                "sma_20": latest.get("SMA_20", 0),
-                "sma_50": latest.get("SMA_50", 0),
-                "volume_ma_20": latest.get("Volume_MA_20", 0),
-                "price_volatility": latest.get("Price_Volatility", 0),
-                "resistance": latest.get("Resistance", 0),
-                "support": latest.get("Support", 0),
-                "atr": latest.get("ATR", 0),
-                "obv": latest.get("OBV", 0),
-                "price_change_pct": latest.get("Price_Change_Pct", 0),
-                "price_vs_sma20": latest.get("Price_vs_SMA20", 0),
-                "price_vs_sma50": latest.get("Price_vs_SMA50", 0),
+            # Read each value straight from its column rather than building
+            # the whole last row as a Series
+            columns = data.columns
+            return {
+                key: data[column].iat[-1] if column in columns else 0
+                for key, column in _LATEST_INDICATOR_COLUMNS
             }
 
-            return indicators
-
         except Exception as e:
             logger.error(f"Error getting latest indicators: {str(e)}")
             return {}
@@ -2,7 +2,10 @@
 Display utilities for formatting and presenting screening results
 """
 
+import sys
+import time
 from datetime import datetime
+from types import MappingProxyType
 
 from models.screening_result import ScreeningResult, ScreeningResults
 
@@ -10,9 +13,39 @@ from models.screening_result import ScreeningResult, ScreeningResults
 class ResultsDisplayService:
     """Service for displaying screening results in a formatted way"""
 
+    # Lookup tables built once and shared read-only by every call
+    CONDITION_EMOJI = MappingProxyType(
+        {
+            "very_bullish": "🚀",
+            "bullish": "📈",
+            "neutral_positive": "➡️",
+            "neutral": "😐",
+            "bearish": "📉",
+            "unknown": "❓",
+        }
+    )
+    HEALTH_EMOJI = MappingProxyType(
+        {"healthy": "✅", "degraded": "⚠️", "unhealthy": "❌", "unknown": "❓"}
+    )
+    STATUS_EMOJI = MappingProxyType(
+        {"healthy": "✅", "unhealthy": "❌", "not_testable": "⚪", "unknown": "❓"}
+    )
+    ERROR_EMOJI = MappingProxyType({"ERROR": "❌", "WARNING": "⚠️", "INFO": "ℹ️"})
+    HEALTH_COMPONENTS = MappingProxyType(
+        {
+            "data_gateway": "Data Gateway",
+            "technical_service": "Technical Analysis",
+            "signal_service": "Signal Detection",
+        }
+    )
+
+    # Minimum seconds between progress bar redraws
+    PROGRESS_REDRAW_INTERVAL = 0.05
+
     def __init__(self):
         self.header_separator = "=" * 80
         self.section_separator = "-" * 80
+        self._last_progress_ts = 0.0
 
     def display_screening_results(self, results: ScreeningResults) -> None:
         """
@@ -71,32 +104,25 @@ class ResultsDisplayService:
         Args:
             analysis (dict): Market analysis data
         """
-        print("\n" + self.header_separator)
-        print(" MARKET CONDITION ANALYSIS")
-        print(self.header_separator)
-
         condition = analysis.get("condition", "unknown")
         signal_pct = analysis.get("signal_percentage", 0)
 
         # Choose emoji based on condition
-        condition_emoji = {
-            "very_bullish": "🚀",
-            "bullish": "📈",
-            "neutral_positive": "➡️",
-            "neutral": "😐",
-            "bearish": "📉",
-            "unknown": "❓",
-        }.get(condition, "❓")
-
-        print(
-            f"\n{condition_emoji} Overall Market Condition: {condition.upper().replace('_', ' ')}"
-        )
-        print(f"📊 Signal Percentage: {signal_pct}%")
-        print(f"📈 Breakout Stocks: {analysis.get('breakout_stocks', 0)}")
-        print(f"📊 Volume Spike Stocks: {analysis.get('volume_spike_stocks', 0)}")
-        print(f"🎯 Total Screened: {analysis.get('total_screened', 0)}")
-
-        print(self.header_separator)
+        condition_emoji = self.CONDITION_EMOJI.get(condition, "❓")
+
+        condition_name = condition.upper().replace("_", " ")
+        lines = [
+            "\n" + self.header_separator,
+            " MARKET CONDITION ANALYSIS",
+            self.header_separator,
+            f"\n{condition_emoji} Overall Market Condition: {condition_name}",
+            f"📊 Signal Percentage: {signal_pct}%",
+            f"📈 Breakout Stocks: {analysis.get('breakout_stocks', 0)}",
+            f"📊 Volume Spike Stocks: {analysis.get('volume_spike_stocks', 0)}",
+            f"🎯 Total Screened: {analysis.get('total_screened', 0)}",
+            self.header_separator,
+        ]
+        self._write_lines(lines)
 
     def _display_single_result(
         self, result: ScreeningResult, show_quality: bool = False
@@ -111,9 +137,12 @@ class ResultsDisplayService:
         stock = result.stock_price
         signals = result.signals
 
-        print(f"\n📈 {stock.symbol}")
-        print(f"   Price: ${stock.current_price} ({stock.price_change_pct:+.2f}%)")
-        print(f"   Volume: {stock.volume:,} (Avg: {stock.avg_volume:,})")
+        # Collect the lines and write them at once rather than print per line
+        lines = [
+            f"\n📈 {stock.symbol}",
+            f"   Price: ${stock.current_price} ({stock.price_change_pct:+.2f}%)",
+            f"   Volume: {stock.volume:,} (Avg: {stock.avg_volume:,})",
+        ]
 
         # Display breakout signals
         if signals.breakout.signal:
@@ -123,22 +152,26 @@ class ResultsDisplayService:
                 else "Unknown"
             )
             strength_pct = signals.breakout.strength * 100
-            print(f"   🔥 BREAKOUT: {signal_type} (Strength: {strength_pct:.2f}%)")
+            lines.append(
+                f"   🔥 BREAKOUT: {signal_type} (Strength: {strength_pct:.2f}%)"
+            )
 
         # Display volume signals
         if signals.volume.signal:
             volume_ratio = signals.volume.volume_ratio
-            print(f"   📊 VOLUME SPIKE: {volume_ratio:.1f}x average")
+            lines.append(f"   📊 VOLUME SPIKE: {volume_ratio:.1f}x average")
 
         # Display quality information if available
-        if show_quality and hasattr(result, "quality"):
+        if show_quality and result.quality is not None:
             quality_info = result.quality
             quality_level = quality_info.get("quality", "unknown")
             confidence = quality_info.get("confidence", 0)
-            print(
+            lines.append(
                 f"   ⭐ Quality: {quality_level.upper()} (Confidence: {confidence:.0%})"
             )
 
+        self._write_lines(lines)
+
     def _display_summary(self, results: ScreeningResults) -> None:
         """
         Display summary statistics
@@ -146,14 +179,26 @@ class ResultsDisplayService:
         Args:
             results (ScreeningResults): Results to summarize
         """
-        print("\n📊 SUMMARY:")
-        print(f"   Total stocks screened: {results.total_screened}")
-        print(f"   Stocks with breakout signals: {results.breakout_count}")
-        print(f"   Stocks with volume spikes: {results.volume_spike_count}")
-        print(f"   Total stocks with signals: {results.signal_count}")
-        print(
-            f"   Screening completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        )
+        completed_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        lines = [
+            "\n📊 SUMMARY:",
+            f"   Total stocks screened: {results.total_screened}",
+            f"   Stocks with breakout signals: {results.breakout_count}",
+            f"   Stocks with volume spikes: {results.volume_spike_count}",
+            f"   Total stocks with signals: {results.signal_count}",
+            f"   Screening completed at: {completed_at}",
+        ]
+        self._write_lines(lines)
+
+    @staticmethod
+    def _write_lines(lines: list[str]) -> None:
+        """
+        Write lines to stdout in a single call
+
+        Args:
+            lines (List[str]): Lines to write, without trailing newlines
+        """
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def display_system_health(self, health_status: dict) -> None:
         """
@@ -169,30 +214,14 @@ class ResultsDisplayService:
         overall = health_status.get("overall", "unknown")
 
         # Choose emoji based on overall health
-        health_emoji = {
-            "healthy": "✅",
-            "degraded": "⚠️",
-            "unhealthy": "❌",
-            "unknown": "❓",
-        }.get(overall, "❓")
+        health_emoji = self.HEALTH_EMOJI.get(overall, "❓")
 
         print(f"\n{health_emoji} Overall Status: {overall.upper()}")
 
         # Display component status
-        components = {
-            "data_gateway": "Data Gateway",
-            "technical_service": "Technical Analysis",
-            "signal_service": "Signal Detection",
-        }
-
-        for key, name in components.items():
+        for key, name in self.HEALTH_COMPONENTS.items():
             status = health_status.get(key, "unknown")
-            status_emoji = {
-                "healthy": "✅",
-                "unhealthy": "❌",
-                "not_testable": "⚪",
-                "unknown": "❓",
-            }.get(status, "❓")
+            status_emoji = self.STATUS_EMOJI.get(status, "❓")
 
             print(f"   {status_emoji} {name}: {status}")
 
@@ -216,11 +245,20 @@ class ResultsDisplayService:
         """
         Display screening progress
 
+        Redraws are throttled to one per PROGRESS_REDRAW_INTERVAL, except for
+        the final update which is always shown.
+
         Args:
             current (int): Current position
             total (int): Total number of stocks
             symbol (str): Current symbol being processed
         """
+        now = time.monotonic()
+        elapsed = now - self._last_progress_ts
+        if current != total and elapsed < self.PROGRESS_REDRAW_INTERVAL:
+            return
+        self._last_progress_ts = now
+
         percentage = (current / total) * 100
         progress_bar = "█" * int(percentage / 5) + "░" * (20 - int(percentage / 5))
 
@@ -241,7 +279,7 @@ class ResultsDisplayService:
             message (str): Error message
             error_type (str): Type of error
         """
-        error_emoji = {"ERROR": "❌", "WARNING": "⚠️", "INFO": "ℹ️"}.get(error_type, "❌")
+        error_emoji = self.ERROR_EMOJI.get(error_type, "❌")
 
         print(f"\n{error_emoji} {error_type}: {message}")
 
@@ -104,15 +104,15 @@ class LoggingConfig:
             # Default log file path
             if log_file_path is None:
                 logs_dir = "logs"
-                os.makedirs(logs_dir, exist_ok=True)
                 timestamp = datetime.now().strftime("%Y%m%d")
                 log_file_path = os.path.join(
                     logs_dir, f"stock_screener_{timestamp}.log"
                 )
 
-            # Create directory if it doesn't exist
+            # Create directory if it doesn't exist (this also covers the
+            # default logs directory)
             log_dir = os.path.dirname(log_file_path)
-            if log_dir:
+            if log_dir and not os.path.isdir(log_dir):
                 os.makedirs(log_dir, exist_ok=True)
 
             # Create rotating file handler
@@ -184,19 +184,29 @@ class PerformanceLogger:
             successful_screens (int): Number of successful screens
             failed_screens (int): Number of failed screens
         """
+        # Skip the derived metrics entirely when the record would be dropped
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         avg_time_per_symbol = execution_time / symbols_count if symbols_count > 0 else 0
         success_rate = (
             (successful_screens / symbols_count * 100) if symbols_count > 0 else 0
         )
 
         self.logger.info(
-            f"Screening Performance: "
-            f"Symbols={symbols_count}, "
-            f"Time={execution_time:.2f}s, "
-            f"Avg/Symbol={avg_time_per_symbol:.2f}s, "
-            f"Success={successful_screens}, "
-            f"Failed={failed_screens}, "
-            f"Success Rate={success_rate:.1f}%"
+            "Screening Performance: "
+            "Symbols=%d, "
+            "Time=%.2fs, "
+            "Avg/Symbol=%.2fs, "
+            "Success=%d, "
+            "Failed=%d, "
+            "Success Rate=%.1f%%",
+            symbols_count,
+            execution_time,
+            avg_time_per_symbol,
+            successful_screens,
+            failed_screens,
+            success_rate,
         )
 
     def log_api_performance(
@@ -211,9 +221,10 @@ class PerformanceLogger:
             data_points (int): Number of data points received
         """
         self.logger.debug(
-            f"API Performance: {symbol} - "
-            f"Time={fetch_time:.2f}s, "
-            f"DataPoints={data_points}"
+            "API Performance: %s - Time=%.2fs, DataPoints=%d",
+            symbol,
+            fetch_time,
+            data_points,
         )
 
 
@@ -2,43 +2,16 @@
 Pytest configuration and fixture registration
 """
 
-# Import all fixtures from the fixtures module
-from tests.utils.fixtures import (
-    sample_stock_data,
-    test_scenarios,
-    screener_config,
-    strict_screener_config,
-    mock_gateway,
-    mock_failing_gateway,
-    data_builder,
-    expected_signals,
-    performance_timer,
-    MockStockDataGateway,
-    TestDataBuilder,
-    PerformanceTimer,
-    # Import assertion helpers too
-    assert_signal_detected,
-    assert_no_signals,
-    assert_signal_strength,
-    assert_volume_ratio,
-)
+# Register the shared fixtures as a plugin instead of re-exporting each one;
+# helpers and builders are imported from tests.utils.fixtures where needed
+pytest_plugins = ("tests.utils.fixtures",)
 
-# Register all fixtures by importing them
-__all__ = [
-    "sample_stock_data",
-    "test_scenarios",
-    "screener_config",
-    "strict_screener_config",
-    "mock_gateway",
-    "mock_failing_gateway",
-    "data_builder",
-    "expected_signals",
-    "performance_timer",
-    "MockStockDataGateway",
-    "TestDataBuilder",
-    "PerformanceTimer",
-    "assert_signal_detected",
-    "assert_no_signals",
-    "assert_signal_strength",
-    "assert_volume_ratio",
-]
+
+def pytest_configure(config):
+    """Register custom markers (pytest.ini shadows the pyproject.toml settings)"""
+    config.addinivalue_line(
+        "markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')"
+    )
+    config.addinivalue_line(
+        "markers", "serial: timing-sensitive tests kept out of parallel runs"
+    )
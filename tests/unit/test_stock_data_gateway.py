@@ -0,0 +1,141 @@
+"""
+Unit tests for YahooFinanceGateway
+"""
+
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from gateways.stock_data_gateway import YahooFinanceGateway
+
+
+class TestYahooFinanceGateway:
+    """Test cases for YahooFinanceGateway"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.gateway = YahooFinanceGateway(cache_dir=None)
+
+    @pytest.mark.parametrize(
+        "last_price, expected",
+        [(187.5, True), (None, False), (float("nan"), False)],
+    )
+    def test_connection_requires_last_price(self, monkeypatch, last_price, expected):
+        """Test that a missing or NaN last price counts as a failed connection"""
+        monkeypatch.delenv("CI", raising=False)
+        monkeypatch.delenv("GITHUB_ACTIONS", raising=False)
+
+        with patch("gateways.stock_data_gateway.yf.Ticker") as ticker:
+            ticker.return_value.fast_info = {"last_price": last_price}
+            assert self.gateway.test_connection() is expected
+
+    def test_connection_fails_on_error(self, monkeypatch):
+        """Test that an exception from the probe counts as a failed connection"""
+        monkeypatch.delenv("CI", raising=False)
+        monkeypatch.delenv("GITHUB_ACTIONS", raising=False)
+
+        with patch(
+            "gateways.stock_data_gateway.yf.Ticker", side_effect=OSError("offline")
+        ):
+            assert self.gateway.test_connection() is False
+
+    def test_fetch_many_splits_batch_per_symbol(self, sample_stock_data):
+        """Test that a grouped batch download is split into per-symbol frames"""
+        # The shorter history leaves all-NaN rows for BBB once aligned
+        aaa = sample_stock_data
+        bbb = sample_stock_data.iloc[10:] * 2
+        batch = pd.concat({"AAA": aaa, "BBB": bbb}, axis=1)
+
+        with patch("gateways.stock_data_gateway.yf.download", return_value=batch):
+            frames = self.gateway.fetch_many(["AAA", "BBB"])
+
+        pd.testing.assert_frame_equal(frames["AAA"], aaa, check_dtype=False)
+        pd.testing.assert_frame_equal(frames["BBB"], bbb, check_dtype=False)
+
+    def test_fetch_many_downloads_duplicates_once(self, sample_stock_data):
+        """Test that repeated symbols are requested once in one batch"""
+        batch = pd.concat({"AAA": sample_stock_data, "BBB": sample_stock_data}, axis=1)
+
+        with patch(
+            "gateways.stock_data_gateway.yf.download", return_value=batch
+        ) as download:
+            frames = self.gateway.fetch_many(["AAA", "BBB", "AAA"])
+
+        download.assert_called_once()
+        assert download.call_args.args[0] == "AAA BBB"
+        assert list(frames) == ["AAA", "BBB"]
+
+    def test_fetch_many_missing_symbol_is_none(self, sample_stock_data):
+        """Test that a symbol absent from the batch maps to None"""
+        batch = pd.concat({"AAA": sample_stock_data}, axis=1)
+
+        with patch("gateways.stock_data_gateway.yf.download", return_value=batch):
+            frames = self.gateway.fetch_many(["AAA", "MISSING"])
+
+        assert frames["AAA"] is not None
+        assert frames["MISSING"] is None
+
+    def test_fetch_many_single_ticker(self, sample_stock_data):
+        """Test that a single-ticker download with flat columns is used as is"""
+        with patch(
+            "gateways.stock_data_gateway.yf.download", return_value=sample_stock_data
+        ):
+            frames = self.gateway.fetch_many(["AAA"])
+
+        pd.testing.assert_frame_equal(frames["AAA"], sample_stock_data)
+
+    def test_fetch_many_served_from_disk_cache(self, tmp_path, sample_stock_data):
+        """Test that a second fetch reads the parquet cache instead of downloading"""
+        gateway = YahooFinanceGateway(cache_dir=tmp_path)
+        data = sample_stock_data.tz_localize("America/New_York")
+
+        with patch(
+            "gateways.stock_data_gateway.yf.download", return_value=data
+        ) as download:
+            gateway.fetch_many(["AAA"])
+            assert gateway._cache_path("AAA", "3mo").is_file()
+
+            frames = gateway.fetch_many(["AAA"])
+
+        download.assert_called_once()
+        assert str(frames["AAA"].index.tz) == "America/New_York"
+        pd.testing.assert_frame_equal(frames["AAA"], data, check_freq=False)
+
+    def test_fetch_many_without_cache_dir_always_downloads(
+        self, tmp_path, sample_stock_data, monkeypatch
+    ):
+        """Test that disabling the cache (--no-cache) bypasses it entirely"""
+        monkeypatch.chdir(tmp_path)
+
+        with patch(
+            "gateways.stock_data_gateway.yf.download", return_value=sample_stock_data
+        ) as download:
+            self.gateway.fetch_many(["AAA"])
+            self.gateway.fetch_many(["AAA"])
+
+        assert self.gateway._cache_path("AAA", "3mo") is None
+        assert download.call_count == 2
+        assert not any(tmp_path.iterdir())
+
+    def test_store_cached_prunes_earlier_days(self, tmp_path, sample_stock_data):
+        """Test that writing today's cache file removes the symbol's older days"""
+        gateway = YahooFinanceGateway(cache_dir=tmp_path)
+        stale = tmp_path / "AAA_3mo_2000-01-03.parquet"
+        other_period = tmp_path / "AAA_1y_2000-01-03.parquet"
+        other_symbol = tmp_path / "AAAB_3mo_2000-01-03.parquet"
+        for path in (stale, other_period, other_symbol):
+            sample_stock_data.to_parquet(path)
+
+        gateway._store_cached("AAA", "3mo", sample_stock_data)
+
+        assert gateway._cache_path("AAA", "3mo").is_file()
+        assert not stale.exists()
+        assert other_period.exists() and other_symbol.exists()
+
+    def test_default_cache_dir_is_independent_of_cwd(self):
+        """Test that the default cache location does not follow the cwd"""
+        from gateways.stock_data_gateway import DEFAULT_CACHE_DIR
+
+        assert DEFAULT_CACHE_DIR.is_absolute()
+        assert YahooFinanceGateway().cache_dir == DEFAULT_CACHE_DIR
@@ -2,31 +2,44 @@
 Test fixtures and mock utilities for stock screener tests
 """
 
+import statistics
+from functools import lru_cache
+from operator import attrgetter
+from time import perf_counter_ns
+from types import MappingProxyType
 from typing import Optional
 from unittest.mock import Mock
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from gateways.stock_data_gateway import StockDataGateway
 from services.screener_service import ScreenerConfiguration
+from services.technical_analysis_service import TechnicalAnalysisService
 from tests.utils.test_data_generator import StockDataGenerator, generate_test_scenarios
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_stock_data():
-    """Generate sample stock data for testing"""
+    """Generate sample stock data for testing (read-only, copy before mutating)"""
     generator = StockDataGenerator("TEST", 100.0)
     return generator.generate_basic_data(60)
 
 
-@pytest.fixture
-def test_scenarios():
-    """Generate all test scenarios"""
+@lru_cache(maxsize=1)
+def _cached_test_scenarios() -> dict[str, pd.DataFrame]:
+    """Test scenarios generated once per process (read-only, copy before mutating)"""
     return generate_test_scenarios()
 
 
 @pytest.fixture
+def test_scenarios():
+    """Copies of all test scenarios, free for the test to modify"""
+    return {name: data.copy() for name, data in _cached_test_scenarios().items()}
+
+
+@pytest.fixture(scope="session")
 def screener_config():
     """Standard screener configuration for testing"""
     return ScreenerConfiguration(
@@ -34,7 +47,7 @@ def screener_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def strict_screener_config():
     """Strict screener configuration for testing edge cases"""
     return ScreenerConfiguration(
@@ -44,11 +57,50 @@ def strict_screener_config():
     )
 
 
+@pytest.fixture(scope="session")
+def technical_service():
+    """Session-wide technical analysis service whose cache is shared by tests"""
+    return TechnicalAnalysisService()
+
+
+@pytest.fixture(scope="session")
+def enhanced_scenarios(technical_service):
+    """Test scenarios with indicators calculated once per session (read-only)"""
+    return {
+        name: technical_service.calculate_all_indicators(data)
+        for name, data in _cached_test_scenarios().items()
+    }
+
+
+@pytest.fixture(scope="session")
+def large_dataset():
+    """1000 days of generated stock data shared by the performance tests"""
+    return StockDataGenerator("TEST", 100.0, seed=42).generate_basic_data(1000)
+
+
+@pytest.fixture(scope="session")
+def large_enhanced(technical_service, large_dataset):
+    """The large dataset with indicators calculated once per session (read-only)"""
+    return technical_service.calculate_all_indicators(large_dataset.copy())
+
+
 class MockStockDataGateway(StockDataGateway):
     """Mock stock data gateway for testing"""
 
+    # Map symbols to test scenarios
+    SYMBOL_SCENARIOS = MappingProxyType(
+        {
+            "TEST_RESISTANCE": "resistance_breakout",
+            "TEST_MA": "ma_breakout",
+            "TEST_VOLUME": "volume_spike",
+            "TEST_NONE": "no_signal",
+            "TEST_FALSE": "false_breakout",
+            "TEST": "resistance_breakout",  # Default
+        }
+    )
+
     def __init__(self, test_data: Optional[dict[str, pd.DataFrame]] = None):
-        self.test_data = test_data or generate_test_scenarios()
+        self.test_data = test_data or _cached_test_scenarios()
         self.fetch_count = 0
         self.last_symbol = None
         self.last_period = None
@@ -70,18 +122,10 @@ class MockStockDataGateway(StockDataGateway):
         self.last_symbol = symbol
         self.last_period = period
 
-        # Map symbols to test scenarios
-        symbol_mapping = {
-            "TEST_RESISTANCE": "resistance_breakout",
-            "TEST_MA": "ma_breakout",
-            "TEST_VOLUME": "volume_spike",
-            "TEST_NONE": "no_signal",
-            "TEST_FALSE": "false_breakout",
-            "TEST": "resistance_breakout",  # Default
-        }
-
-        scenario = symbol_mapping.get(symbol, "no_signal")
-        return self.test_data.get(scenario)
+        scenario = self.SYMBOL_SCENARIOS.get(symbol, "no_signal")
+        data = self.test_data.get(scenario)
+        # The scenarios are shared between gateways, so hand out copies
+        return None if data is None else data.copy()
 
     def test_connection(self) -> bool:
         """Mock connection test"""
@@ -99,10 +143,19 @@ def mock_failing_gateway():
     """Mock gateway that simulates failures"""
     gateway = Mock()
     gateway.fetch_stock_data.return_value = None
+    gateway.fetch_many.return_value = {}
     gateway.test_connection.return_value = False
     return gateway
 
 
+@lru_cache(maxsize=32)
+def _basic_data_template(
+    symbol: str, base_price: float, seed: int, days: int
+) -> pd.DataFrame:
+    """Generated basic data shared by builders (read-only, copy before mutating)"""
+    return StockDataGenerator(symbol, base_price, seed).generate_basic_data(days)
+
+
 class TestDataBuilder:
     """Builder class for creating custom test data"""
 
@@ -112,7 +165,11 @@ class TestDataBuilder:
 
     def with_basic_data(self, days: int = 60):
         """Add basic data"""
-        self.data = self.generator.generate_basic_data(days)
+        # The generator is seeded, so identical arguments give identical data
+        generator = self.generator
+        self.data = _basic_data_template(
+            generator.symbol, generator.base_price, generator.seed, days
+        ).copy()
         return self
 
     def with_resistance_at(self, level: float, from_day: int = 30, to_day: int = 50):
@@ -120,10 +177,11 @@ class TestDataBuilder:
         if self.data is None:
             self.with_basic_data()
 
-        for i in range(from_day, min(to_day, len(self.data))):
-            self.data.iloc[i, self.data.columns.get_loc("High")] = min(
-                self.data.iloc[i]["High"], level
-            )
+        days = slice(from_day, min(to_day, len(self.data)))
+        high_col = self.data.columns.get_loc("High")
+        self.data.iloc[days, high_col] = np.minimum(
+            self.data["High"].iloc[days].to_numpy(), level
+        )
         return self
 
     def with_breakout_on_day(
@@ -134,10 +192,14 @@ class TestDataBuilder:
             self.with_basic_data()
 
         if day < len(self.data):
-            self.data.iloc[day, self.data.columns.get_loc("Close")] = price
-            self.data.iloc[day, self.data.columns.get_loc("High")] = price * 1.01
-            self.data.iloc[day, self.data.columns.get_loc("Volume")] = int(
-                self.data.iloc[day]["Volume"] * volume_multiplier
+            close_col, high_col, volume_col = (
+                self.data.columns.get_loc(column)
+                for column in ("Close", "High", "Volume")
+            )
+            self.data.iat[day, close_col] = price
+            self.data.iat[day, high_col] = price * 1.01
+            self.data.iat[day, volume_col] = int(
+                self.data.iat[day, volume_col] * volume_multiplier
             )
         return self
 
@@ -147,8 +209,9 @@ class TestDataBuilder:
             self.with_basic_data()
 
         if day < len(self.data):
-            self.data.iloc[day, self.data.columns.get_loc("Volume")] = int(
-                self.data.iloc[day]["Volume"] * multiplier
+            volume_col = self.data.columns.get_loc("Volume")
+            self.data.iat[day, volume_col] = int(
+                self.data.iat[day, volume_col] * multiplier
             )
         return self
 
@@ -159,12 +222,23 @@ class TestDataBuilder:
         return self.data
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def data_builder():
     """Test data builder fixture"""
     return TestDataBuilder
 
 
+@pytest.fixture(scope="class")
+def resistance_frame():
+    """60 days with resistance at 110 over days 30-55, built once per class"""
+    return (
+        TestDataBuilder("TEST", 100.0)
+        .with_basic_data(60)
+        .with_resistance_at(110.0, 30, 55)
+        .build()
+    )
+
+
 def create_expected_signals(
     breakout: bool = False,
     breakout_type: str = None,
@@ -195,7 +269,7 @@ def create_expected_signals(
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def expected_signals():
     """Factory for creating expected signal results"""
     return create_expected_signals
@@ -208,21 +282,43 @@ class PerformanceTimer:
     def __init__(self):
         self.start_time = None
         self.end_time = None
+        self.median = None
 
     def start(self):
-        import time
-
-        self.start_time = time.time()
+        self.median = None
+        self.start_time = perf_counter_ns()
 
     def stop(self):
-        import time
+        self.end_time = perf_counter_ns()
+
+    def measure(self, func, *args, rounds: int = 5, warmup_rounds: int = 1):
+        """
+        Time func(*args) over several rounds after warming up
 
-        self.end_time = time.time()
+        elapsed becomes the median round time, so a single slow round on a
+        noisy machine does not fail a threshold assertion.
+
+        Returns:
+            The result of the last call
+        """
+        for _ in range(warmup_rounds):
+            func(*args)
+        timings = []
+        for _ in range(rounds):
+            start = perf_counter_ns()
+            result = func(*args)
+            timings.append(perf_counter_ns() - start)
+        self.start_time = self.end_time = None
+        self.median = statistics.median(timings)
+        return result
 
     @property
     def elapsed(self) -> float:
-        if self.start_time and self.end_time:
-            return self.end_time - self.start_time
+        """Elapsed seconds (the median round for measure)"""
+        if self.median is not None:
+            return self.median / 1e9
+        if self.start_time is not None and self.end_time is not None:
+            return (self.end_time - self.start_time) / 1e9
         return 0.0
 
 
@@ -233,14 +329,29 @@ def performance_timer():
 
 
 # Assertion helpers
+# Signal type -> (check on a screening result, failure message)
+_SIGNAL_CHECKS = MappingProxyType(
+    {
+        "any": (
+            attrgetter("signals.has_any_signal"),
+            "Expected a signal to be detected",
+        ),
+        "breakout": (
+            attrgetter("signals.breakout.signal"),
+            "Expected breakout signal to be detected",
+        ),
+        "volume": (
+            attrgetter("signals.volume.signal"),
+            "Expected volume signal to be detected",
+        ),
+    }
+)
+
+
 def assert_signal_detected(result, signal_type: str = "any"):
     """Assert that a signal was detected"""
-    if signal_type == "any":
-        assert result.signals.has_any_signal, "Expected a signal to be detected"
-    elif signal_type == "breakout":
-        assert result.signals.breakout.signal, "Expected breakout signal to be detected"
-    elif signal_type == "volume":
-        assert result.signals.volume.signal, "Expected volume signal to be detected"
+    check, message = _SIGNAL_CHECKS[signal_type]
+    assert check(result), message
 
 
 def assert_no_signals(result):
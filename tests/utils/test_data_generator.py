@@ -9,12 +9,30 @@ import numpy as np
 import pandas as pd
 
 
+def _set_columns(data: pd.DataFrame, rows, **columns) -> None:
+    """
+    Assign values to several columns over the same rows, by position
+
+    Args:
+        data (pd.DataFrame): Frame to modify in place
+        rows (int or slice): Row position or positional slice
+        **columns: Column name -> scalar or array of values for the rows
+    """
+    for name, values in columns.items():
+        data.iloc[rows, data.columns.get_loc(name)] = values
+
+
 class StockDataGenerator:
     """Generator for creating sample stock data for testing"""
 
-    def __init__(self, symbol: str = "TEST", base_price: float = 100.0):
+    def __init__(self, symbol: str = "TEST", base_price: float = 100.0, seed: int = 42):
         self.symbol = symbol
         self.base_price = base_price
+        self.seed = seed
+        # Private stream, reseeded by every generate_basic_data call so equal
+        # arguments give equal data. The scenarios are tuned to the legacy
+        # Mersenne Twister sequence, so this is a RandomState, not a Generator.
+        self._rng = np.random.RandomState(seed)
 
     def generate_basic_data(
         self, days: int = 60, start_date: Optional[datetime] = None
@@ -35,43 +53,48 @@ class StockDataGenerator:
         dates = pd.date_range(start=start_date, periods=days, freq="D")
 
         # Generate realistic price movement
-        np.random.seed(42)  # For reproducible tests
-        daily_returns = np.random.normal(0.001, 0.02, days)  # 0.1% mean, 2% volatility
-
-        prices = [self.base_price]
-        for i in range(1, days):
-            price = prices[-1] * (1 + daily_returns[i])
-            prices.append(max(price, 1.0))  # Ensure price doesn't go below $1
-
-        # Generate OHLC from close prices
-        data = []
-        for i, (_date, close) in enumerate(zip(dates, prices)):
-            # Add some intraday volatility
-            volatility = close * 0.02  # 2% intraday range
-            high = close + np.random.uniform(0, volatility)
-            low = close - np.random.uniform(0, volatility)
-            open_price = close + np.random.uniform(-volatility / 2, volatility / 2)
-
-            # Ensure OHLC relationships are valid
-            high = max(high, open_price, close)
-            low = min(low, open_price, close)
-
-            # Generate volume (higher volume on larger price moves)
-            base_volume = 1000000
-            volume_multiplier = 1 + abs(daily_returns[i]) * 10
-            volume = int(base_volume * volume_multiplier * np.random.uniform(0.5, 1.5))
-
-            data.append(
-                {
-                    "Open": round(open_price, 2),
-                    "High": round(high, 2),
-                    "Low": round(low, 2),
-                    "Close": round(close, 2),
-                    "Volume": volume,
-                }
-            )
-
-        df = pd.DataFrame(data, index=dates)
+        self._rng.seed(self.seed)  # For reproducible tests
+        daily_returns = self._rng.normal(0.001, 0.02, days)  # 0.1% mean, 2% volatility
+
+        # Compound the returns from the base price; the first day's return is
+        # unused. Cumulating [base, 1 + r1, ...] multiplies in the same order
+        # as a day-by-day walk.
+        growth = 1 + daily_returns
+        growth[:1] = self.base_price  # Slice so zero days still works
+        prices = np.cumprod(growth)
+        # Ensure price doesn't go below $1 (floors the day rather than
+        # restarting the walk from $1, which needs a ~99% drawdown to matter)
+        np.maximum(prices, 1.0, out=prices)
+
+        # Generate OHLC from close prices. Each day draws high, low, open and
+        # volume noise in turn, so one (days, 4) draw keeps the sequence.
+        high_u, low_u, open_u, volume_u = self._rng.random_sample((days, 4)).T
+
+        # Add some intraday volatility
+        volatility = prices * 0.02  # 2% intraday range
+        high = prices + volatility * high_u
+        low = prices - volatility * low_u
+        open_price = prices + (-volatility / 2 + volatility * open_u)
+
+        # Ensure OHLC relationships are valid
+        high = np.maximum.reduce([high, open_price, prices])
+        low = np.minimum.reduce([low, open_price, prices])
+
+        # Generate volume (higher volume on larger price moves)
+        base_volume = 1000000
+        volume_multiplier = 1 + np.abs(daily_returns) * 10
+        volume = base_volume * volume_multiplier * (0.5 + volume_u)
+
+        df = pd.DataFrame(
+            {
+                "Open": np.round(open_price, 2),
+                "High": np.round(high, 2),
+                "Low": np.round(low, 2),
+                "Close": np.round(prices, 2),
+                "Volume": volume.astype(np.int64),
+            },
+            index=dates,
+        )
         return df
 
     def generate_resistance_breakout_scenario(self) -> pd.DataFrame:
@@ -87,32 +110,38 @@ class StockDataGenerator:
         resistance_level = self.base_price * 1.10
 
         # Days 30-50: Price approaches but doesn't break resistance
-        for i in range(30, 50):
-            data.iloc[i, data.columns.get_loc("High")] = min(
-                data.iloc[i]["High"], resistance_level - 0.50
-            )
-            data.iloc[i, data.columns.get_loc("Close")] = min(
-                data.iloc[i]["Close"], resistance_level - 1.00
-            )
+        consolidation = slice(30, 50)
+        _set_columns(
+            data,
+            consolidation,
+            High=np.minimum(data["High"].iloc[consolidation], resistance_level - 0.50),
+            Close=np.minimum(
+                data["Close"].iloc[consolidation], resistance_level - 1.00
+            ),
+        )
 
         # Day 55: Breakout with high volume
         breakout_day = 55
-        data.iloc[breakout_day, data.columns.get_loc("High")] = resistance_level + 2.00
-        data.iloc[breakout_day, data.columns.get_loc("Close")] = resistance_level + 1.50
-        data.iloc[breakout_day, data.columns.get_loc("Volume")] = int(
-            data.iloc[breakout_day]["Volume"] * 3.0  # 3x volume spike
+        _set_columns(
+            data,
+            breakout_day,
+            High=resistance_level + 2.00,
+            Close=resistance_level + 1.50,
+            Volume=int(data["Volume"].iat[breakout_day] * 3.0),  # 3x volume spike
         )
 
-        # Days after breakout: Maintain higher levels
-        for i in range(breakout_day + 1, len(data)):
-            # Ensure price stays above resistance level
-            data.iloc[i, data.columns.get_loc("Close")] = (
-                resistance_level + 1.0 + (i - breakout_day) * 0.5
-            )
-            data.iloc[i, data.columns.get_loc("High")] = data.iloc[i]["Close"] + 1.0
-            data.iloc[i, data.columns.get_loc("Low")] = max(
-                data.iloc[i]["Low"], resistance_level
-            )
+        # Days after breakout: Maintain higher levels, with the price staying
+        # above the resistance level
+        after = slice(breakout_day + 1, len(data))
+        days_since = np.arange(1, len(data) - breakout_day)
+        close = resistance_level + 1.0 + days_since * 0.5
+        _set_columns(
+            data,
+            after,
+            Close=close,
+            High=close + 1.0,
+            Low=np.maximum(data["Low"].iloc[after], resistance_level),
+        )
 
         return data
 
@@ -127,38 +156,51 @@ class StockDataGenerator:
 
         # Create a more controlled pattern for MA breakout
         # Days 0-40: Higher prices to establish higher SMA_50
-        for i in range(40):
-            price = self.base_price * (1.02 - i * 0.005)  # Gradual decline from higher level
-            data.iloc[i, data.columns.get_loc("Close")] = price
-            data.iloc[i, data.columns.get_loc("High")] = price * 1.01
-            data.iloc[i, data.columns.get_loc("Low")] = price * 0.99
-            data.iloc[i, data.columns.get_loc("Open")] = price
+        # Gradual decline from higher level
+        price = self.base_price * (1.02 - np.arange(40) * 0.005)
+        _set_columns(
+            data,
+            slice(0, 40),
+            Close=price,
+            High=price * 1.01,
+            Low=price * 0.99,
+            Open=price,
+        )
 
         # Days 40-58: Lower consolidation to create SMA_20 < SMA_50 but recent recovery
         consolidation_price = self.base_price * 0.87
-        for i in range(40, 58):
-            # Gradual recovery but still below what will become SMA_20
-            recovery_factor = (i - 40) / 18 * 0.08  # Gradual 8% recovery over 18 days
-            price = consolidation_price + recovery_factor * self.base_price
-            data.iloc[i, data.columns.get_loc("Close")] = price
-            data.iloc[i, data.columns.get_loc("High")] = price * 1.01
-            data.iloc[i, data.columns.get_loc("Low")] = price * 0.99
-            data.iloc[i, data.columns.get_loc("Open")] = price
+        # Gradual recovery but still below what will become SMA_20
+        recovery_factor = np.arange(18) / 18 * 0.08  # Gradual 8% recovery over 18 days
+        price = consolidation_price + recovery_factor * self.base_price
+        _set_columns(
+            data,
+            slice(40, 58),
+            Close=price,
+            High=price * 1.01,
+            Low=price * 0.99,
+            Open=price,
+        )
 
         # Day 58: Make sure this is clearly below SMA_20
         pre_breakout_price = self.base_price * 0.87  # Lower to ensure below SMA_20
-        data.iloc[58, data.columns.get_loc("Close")] = pre_breakout_price
-        data.iloc[58, data.columns.get_loc("High")] = pre_breakout_price * 1.01
-        data.iloc[58, data.columns.get_loc("Low")] = pre_breakout_price * 0.99
-        data.iloc[58, data.columns.get_loc("Open")] = pre_breakout_price
+        _set_columns(
+            data,
+            58,
+            Close=pre_breakout_price,
+            High=pre_breakout_price * 1.01,
+            Low=pre_breakout_price * 0.99,
+            Open=pre_breakout_price,
+        )
 
         # Day 59 (last day): Clear MA breakout with volume
         breakout_price = self.base_price * 0.98  # Above SMA_20 but reasonable
-        data.iloc[59, data.columns.get_loc("Close")] = breakout_price
-        data.iloc[59, data.columns.get_loc("High")] = breakout_price * 1.02
-        data.iloc[59, data.columns.get_loc("Low")] = breakout_price * 0.98
-        data.iloc[59, data.columns.get_loc("Volume")] = int(
-            data.iloc[59]["Volume"] * 2.5
+        _set_columns(
+            data,
+            59,
+            Close=breakout_price,
+            High=breakout_price * 1.02,
+            Low=breakout_price * 0.98,
+            Volume=int(data["Volume"].iat[59] * 2.5),
         )
 
         return data
@@ -174,15 +216,14 @@ class StockDataGenerator:
 
         # Day 55: Volume spike without significant price change
         spike_day = 55
-        data.iloc[spike_day, data.columns.get_loc("Volume")] = int(
-            data.iloc[spike_day]["Volume"] * 4.0  # 4x volume spike
-        )
-
         # Keep price relatively stable
-        avg_price = data.iloc[50:55]["Close"].mean()
-        data.iloc[spike_day, data.columns.get_loc("Close")] = (
-            avg_price * 1.005
-        )  # Minimal price change
+        avg_price = data["Close"].iloc[50:55].mean()
+        _set_columns(
+            data,
+            spike_day,
+            Volume=int(data["Volume"].iat[spike_day] * 4.0),  # 4x volume spike
+            Close=avg_price * 1.005,  # Minimal price change
+        )
 
         return data
 
@@ -198,23 +239,24 @@ class StockDataGenerator:
         # Ensure no volume spikes or breakouts
         # Normalize volume to avoid spikes - very tight range
         avg_volume = data["Volume"].mean()
-        data["Volume"] = [
-            int(avg_volume * np.random.uniform(0.8, 1.2)) for _ in range(len(data))
-        ]
+        volume_noise = self._rng.uniform(0.8, 1.2, len(data))
+        data["Volume"] = (avg_volume * volume_noise).astype(np.int64)
 
         # Keep price completely flat to prevent any breakouts
         # No trend, no variation - just flat trading
         flat_price = self.base_price * 0.99  # Fixed price slightly below base
-        
-        for i in range(len(data)):
-            # Completely flat with minimal noise
-            noise = np.random.uniform(-0.01, 0.01)  # Only 1% noise
-            price = flat_price * (1 + noise)
-            
-            data.iloc[i, data.columns.get_loc("Close")] = price
-            data.iloc[i, data.columns.get_loc("High")] = price * 1.002  # Tiny high
-            data.iloc[i, data.columns.get_loc("Low")] = price * 0.998   # Tiny low
-            data.iloc[i, data.columns.get_loc("Open")] = price
+
+        # Completely flat with minimal noise
+        noise = self._rng.uniform(-0.01, 0.01, len(data))  # Only 1% noise
+        price = flat_price * (1 + noise)
+        _set_columns(
+            data,
+            slice(0, len(data)),
+            Close=price,
+            High=price * 1.002,  # Tiny high
+            Low=price * 0.998,  # Tiny low
+            Open=price,
+        )
 
         return data
 
@@ -230,19 +272,21 @@ class StockDataGenerator:
         resistance_level = self.base_price * 1.10
 
         # Create resistance level
-        for i in range(30, 50):
-            data.iloc[i, data.columns.get_loc("High")] = min(
-                data.iloc[i]["High"], resistance_level
-            )
+        resistance_days = slice(30, 50)
+        _set_columns(
+            data,
+            resistance_days,
+            High=np.minimum(data["High"].iloc[resistance_days], resistance_level),
+        )
 
         # Day 55: Brief breakout but low volume
         breakout_day = 55
-        data.iloc[breakout_day, data.columns.get_loc("High")] = resistance_level + 1.00
-        data.iloc[breakout_day, data.columns.get_loc("Close")] = (
-            resistance_level - 0.50
-        )  # Close back below
-        data.iloc[breakout_day, data.columns.get_loc("Volume")] = int(
-            data.iloc[breakout_day]["Volume"] * 0.8  # Lower volume
+        _set_columns(
+            data,
+            breakout_day,
+            High=resistance_level + 1.00,
+            Close=resistance_level - 0.50,  # Close back below
+            Volume=int(data["Volume"].iat[breakout_day] * 0.8),  # Lower volume
         )
 
         return data